@@ -0,0 +1,31 @@
+''' Schemdraw drawing backends '''
+
+from .. import default_canvas
+
+
+def import_mpl() -> bool:
+    ''' Import the Matplotlib backend, if not already imported.
+        Matplotlib that is installed but fails to import is marked
+        as unavailable, and the default canvas falls back to SVG.
+
+        Returns:
+            True if the Matplotlib backend is available
+    '''
+    if default_canvas.matplotlib_installed:
+        try:
+            from . import mpl  # noqa: F401
+        except ImportError:
+            default_canvas.matplotlib_installed = False
+            if default_canvas.default_canvas == 'matplotlib':
+                default_canvas.default_canvas = 'svg'
+    return default_canvas.matplotlib_installed
+
+
+def mplFigure(**kwargs):
+    ''' Create a Matplotlib backend Figure. Matplotlib is imported
+        on first use rather than when schemdraw is imported.
+    '''
+    if not import_mpl():
+        raise ValueError('Could not import Matplotlib.')
+    from .mpl import Figure
+    return Figure(**kwargs)
@@ -1,17 +1,24 @@
 ''' Matplotlib drawing backend for schemdraw '''
 
 from __future__ import annotations
-from typing import Optional, Sequence, BinaryIO
+from typing import Any, Optional, Sequence, BinaryIO
 from io import BytesIO
 import warnings
 import math
+import threading
 
+import numpy as np  # type: ignore
 import matplotlib  # type: ignore
 import matplotlib.pyplot as plt  # type: ignore
 from matplotlib import font_manager, transforms
-from matplotlib.patches import Arc, Rectangle, PathPatch, Path # type: ignore
+from matplotlib.figure import Figure as MplFigure  # type: ignore
+from matplotlib.backends.backend_agg import FigureCanvasAgg  # type: ignore
+from matplotlib.artist import Artist  # type: ignore
+from matplotlib.patches import Arc, Rectangle, Path  # type: ignore
+from matplotlib.collections import PathCollection  # type: ignore
 
 from .. import util
+from .simplify import simplify, simplify_xy
 from ..types import Capstyle, Joinstyle, Linestyle, BBox, XY, Gradient
 
 inline = 'inline' in matplotlib.get_backend()
@@ -24,39 +31,158 @@ def fix_capstyle(capstyle):
     return capstyle
 
 
+def path_capstyle(capstyle: Optional[str], ls: Linestyle, closed: bool) -> Optional[str]:
+    ''' Cap style of a batched path. Closed solid paths have no line
+        ends, so their cap style is None and any batch accepts them.
+        Dashes of closed paths still have ends.
+    '''
+    if closed and ls in ('-', 'solid'):
+        return None
+    return fix_capstyle(capstyle)
+
+
+class FigurePool:
+    ''' Bounded pool of headless Matplotlib figures. Figures are
+        drawn on FigureCanvasAgg and not managed by pyplot.
+
+        Args:
+            maxsize: Maximum number of released figures kept for reuse
+    '''
+    def __init__(self, maxsize: int = 4):
+        self.maxsize = maxsize
+        self._figures: list[tuple[MplFigure, Any]] = []
+        self._lock = threading.Lock()
+
+    def acquire(self) -> tuple[MplFigure, Any]:
+        ''' Get a figure and axis, reusing a released one if available '''
+        with self._lock:
+            if self._figures:
+                return self._figures.pop()
+        fig = MplFigure()
+        FigureCanvasAgg(fig)
+        ax = fig.add_subplot()
+        return fig, ax
+
+    def release(self, fig: MplFigure, ax: Any) -> None:
+        ''' Clear the figure and keep it for reuse, unless the pool is full '''
+        ax.clear()
+        fig.set_facecolor(matplotlib.rcParams['figure.facecolor'])
+        with self._lock:
+            if len(self._figures) < self.maxsize:
+                self._figures.append((fig, ax))
+
+    def clear(self) -> None:
+        ''' Discard all pooled figures '''
+        with self._lock:
+            self._figures = []
+
+
+figure_pool = FigurePool()
+
+
+def polygon_path(verts: Sequence[XY], closed: bool = True) -> Path:
+    ''' Get Path of a polygon, the same as matplotlib.patches.Polygon '''
+    xy = np.asarray(verts, dtype=float).reshape(-1, 2)
+    if closed and (len(xy) == 0 or (xy[0] != xy[-1]).any()):
+        xy = np.concatenate([xy, [xy[0]]])
+    elif not closed and len(xy) > 2 and (xy[0] == xy[-1]).all():
+        xy = xy[:-1]
+    return Path(xy, closed=closed)
+
+
+class PathBatch:
+    ''' Paths to draw as one PathCollection. Colors, line widths, and
+        line styles are set for each path. Clip, hatch, cap style,
+        and join style are shared by all paths.
+    '''
+    def __init__(self, clip: Optional[BBox], hatch: Optional[str],
+                 capstyle: Optional[str], joinstyle: Optional[str]):
+        self.clip = clip
+        self.hatch = hatch
+        self.capstyle = capstyle
+        self.joinstyle = joinstyle
+        self.paths: list[Path] = []
+        self.edgecolors: list = []
+        self.facecolors: list = []
+        self.linewidths: list[float] = []
+        self.linestyles: list = []
+
+    def accepts(self, clip: Optional[BBox], hatch: Optional[str],
+                capstyle: Optional[str], joinstyle: Optional[str]) -> bool:
+        ''' Whether a path with these properties can be added. A cap or
+            join style of None means the path doesn't depend on it.
+        '''
+        return (clip == self.clip and hatch == self.hatch
+                and (capstyle is None or self.capstyle is None or capstyle == self.capstyle)
+                and (joinstyle is None or self.joinstyle is None or joinstyle == self.joinstyle))
+
+    def add(self, path: Path, edgecolor, facecolor, linewidth: float, linestyle,
+            capstyle: Optional[str], joinstyle: Optional[str]) -> None:
+        ''' Add a path to the batch '''
+        self.capstyle = self.capstyle or capstyle
+        self.joinstyle = self.joinstyle or joinstyle
+        self.paths.append(path)
+        self.edgecolors.append(edgecolor)
+        self.facecolors.append(facecolor)
+        self.linewidths.append(linewidth)
+        self.linestyles.append(linestyle)
+
+    def collection(self, zorder: float) -> PathCollection:
+        ''' Make the PathCollection '''
+        return PathCollection(self.paths, edgecolors=self.edgecolors, facecolors=self.facecolors,
+                              linewidths=self.linewidths, linestyles=self.linestyles,
+                              hatch=self.hatch, capstyle=self.capstyle, joinstyle=self.joinstyle,
+                              zorder=zorder)
+
+
 class Figure:
     ''' Schemdraw figure on Matplotlib figure
 
+        Lines and shapes are batched. Consecutive paths with the same
+        zorder and clip are drawn as one PathCollection, keeping the
+        draw order within each zorder.
+
         Args:
             bbox: Coordinate bounding box for drawing, used to
                 override Matplotlib's autoscale
             inches_per_unit: Scale for the drawing
             showbbox: Draw bounding box and margin box
             ax: Existing Matplotlib axis to draw on
+            simplify: Tolerance, in drawing units, for removing
+                points from polylines and polygons. Zero disables.
+            headless: Draw on a figure from `figure_pool`, without
+                pyplot. Call `release` when done with the figure.
     '''
     def __init__(self, **kwargs):
         self.showbbox = kwargs.get('showbbox', False)
         self.bbox = kwargs.get('bbox', None)
         self.inches_per_unit = kwargs.get('inches_per_unit', .5)
+        self.simplify = kwargs.get('simplify', 0) or 0
+        self.headless = False
         if kwargs.get('ax'):
             self.ax = kwargs.get('ax')
             self.fig = self.ax.figure
             self.userfig = True
         else:
-            # a Figure (big F) is not part of the pyplot interface
-            # so won't be shown double in Jupyter/inline interfaces.
-            # But a figure (small f) is required to show the image in
-            # MPL's popup GUI.
-            if inline:
-                self.fig = plt.Figure()
+            if kwargs.get('headless'):
+                self.fig, self.ax = figure_pool.acquire()
+                self.headless = True
             else:
-                self.fig = plt.figure()
+                # a Figure (big F) is not part of the pyplot interface
+                # so won't be shown double in Jupyter/inline interfaces.
+                # But a figure (small f) is required to show the image in
+                # MPL's popup GUI.
+                if inline:
+                    self.fig = plt.Figure()
+                    FigureCanvasAgg(self.fig)  # Renderer for measuring text before saving
+                else:
+                    self.fig = plt.figure()
+                self.ax = self.fig.add_subplot()
             self.fig.subplots_adjust(
                 left=0.0,
                 bottom=0.0,
                 right=1.,
                 top=1.)
-            self.ax = self.fig.add_subplot()
             self.userfig = False
             self.ax.set_aspect('equal')
             self.ax.axes.get_xaxis().set_visible(False)
@@ -66,6 +192,15 @@ class Figure:
         # whitespace around contents
         self.margin = kwargs.get('margin', .1) + .03  # Plus half a line width for linecaps
 
+        # Paths not yet added to the axis, for each zorder
+        self._batches: dict[float, PathBatch] = {}
+
+        # Every artist added to the axis, in order, so callers can
+        # find (and remove) the artists drawn for one element
+        self.artists: list[Artist] = []
+        self._drawn = False    # Canvas drawn with the current limits
+        self._drawcid: Optional[int] = None
+
     def set_bbox(self, bbox: BBox):
         ''' Set bounding box, to override Matplotlib's autoscale '''
         self.bbox = bbox
@@ -75,7 +210,7 @@ class Figure:
             when running inline (ie Jupyter) which shows the
             figure using _repr_ methods.
         '''
-        if not inline:
+        if not inline and not self.headless:
             self.getfig()
             self.fig.show()
             plt.show()   # To start the MPL event loop
@@ -97,17 +232,81 @@ class Figure:
                                  transform=self.ax.transData)
             patch.set_clip_path(cliprect)
 
+    def addpath(self, path: Path, zorder: float, clip: Optional[BBox] = None,
+                edgecolor: Any = 'black', facecolor: Any = 'none', lw: float = 2,
+                ls: Linestyle = '-', hatch: Optional[str] = None,
+                capstyle: Optional[str] = None, joinstyle: Optional[str] = None) -> None:
+        ''' Add a path to the batch for its zorder.
+
+            Args:
+                path: Path in data coordinates
+                zorder: Z-order
+                clip: Clip box
+                edgecolor: Stroke color
+                facecolor: Fill color
+                lw: Line width
+                ls: Line style
+                hatch: Matplotlib hatch pattern
+                capstyle: Cap style, or None if the path has no line ends
+                joinstyle: Join style, or None if the path has no corners
+        '''
+        batch = self._batches.get(zorder)
+        if batch is None or not batch.accepts(clip, hatch, capstyle, joinstyle):
+            self._flushzorder(zorder)
+            batch = self._batches[zorder] = PathBatch(clip, hatch, capstyle, joinstyle)
+        batch.add(path, edgecolor, facecolor, lw, ls, capstyle, joinstyle)
+
+    def _flushzorder(self, zorder: float) -> None:
+        ''' Add the batched paths for one zorder to the axis. Must be called
+            before adding any other artist with this zorder to keep draw order.
+        '''
+        batch = self._batches.pop(zorder, None)
+        if batch is not None:
+            collection = batch.collection(zorder)
+            self.ax.add_collection(collection)
+            self.addclip(collection, batch.clip)
+            self.artists.append(collection)
+
+    def flush(self) -> None:
+        ''' Add all batched paths to the axis '''
+        for zorder in list(self._batches):
+            self._flushzorder(zorder)
+
     def plot(self, x: float, y: float, color: str = 'black', ls: Linestyle = '-',
              lw: float = 2, fill: Optional[str] = None, capstyle: Capstyle = 'round',
              joinstyle: Joinstyle = 'round', clip: Optional[BBox] = None, zorder: int = 2) -> None:
         ''' Plot a path '''
-        p, = self.ax.plot(x, y, zorder=zorder, color=color, ls=ls, lw=lw,
-                          solid_capstyle=fix_capstyle(capstyle),
-                          solid_joinstyle=joinstyle)
-        self.addclip(p, clip)
+        if self.simplify > 0:
+            x, y = simplify_xy(x, y, self.simplify)  # type: ignore
         if fill:
+            self._flushzorder(zorder-1)
             p, = self.ax.fill(x, y, color=fill, zorder=zorder-1)
             self.addclip(p, clip)
+            self.artists.append(p)
+
+        if ls not in ['-', 'solid']:
+            # Line2D dashes use different caps than solid lines
+            self._flushzorder(zorder)
+            p, = self.ax.plot(x, y, zorder=zorder, color=color, ls=ls, lw=lw,
+                              solid_capstyle=fix_capstyle(capstyle),
+                              solid_joinstyle=joinstyle)
+            self.addclip(p, clip)
+            self.artists.append(p)
+            return
+
+        # Break the line at NaNs, like Line2D
+        xy = np.column_stack([np.asarray(x, dtype=float), np.asarray(y, dtype=float)])
+        isnan = np.isnan(xy).any(axis=1)
+        if isnan.any():
+            breaks = np.flatnonzero(isnan)
+            runs = np.split(xy, breaks)
+            runs = [runs[0]] + [r[1:] for r in runs[1:]]
+        else:
+            runs = [xy]
+        for run in runs:
+            if len(run):
+                self.addpath(Path(run), zorder, clip, edgecolor=color, lw=lw,
+                             capstyle=fix_capstyle(capstyle), joinstyle=joinstyle)
 
     def text(self, s: str, x: float, y: float, color: str = 'black',
              fontsize: float = 14,
@@ -134,6 +333,7 @@ class Figure:
         if bgcolor:
             bbox = {'facecolor': bgcolor, 'pad': 2, 'edgecolor': 'none'}
 
+        self._flushzorder(zorder)
         t = self.ax.text(x, y, s, transform=self.ax.transData, color=color,
                          fontsize=fontsize, fontfamily=fontfamily,
                          math_fontfamily=mathfont, linespacing=1,
@@ -142,6 +342,7 @@ class Figure:
                          bbox=bbox, url=href,
                          zorder=zorder, clip_on=False)
         self.addclip(t, clip)
+        self.artists.append(t)
 
     def poly(self, verts: Sequence[XY], closed: bool = True,
              color: str = 'black', fill: Optional[str] = None,
@@ -150,20 +351,60 @@ class Figure:
              clip: Optional[BBox] = None, zorder: int = 1) -> None:
         ''' Draw a polynomial '''
         h = '///////' if hatch else None
-        p = plt.Polygon(verts, closed=closed, ec=color,
-                        fc=fill, fill=fill is not None,
-                        lw=lw, ls=ls, hatch=h, capstyle=fix_capstyle(capstyle),
-                        joinstyle=joinstyle, zorder=zorder)
-        self.ax.add_patch(p)
-        self.addclip(p, clip)
+        if self.simplify > 0:
+            verts = simplify(verts, self.simplify)
+        self.addpath(polygon_path(verts, closed), zorder, clip, edgecolor=color,
+                     facecolor='none' if fill is None else fill, lw=lw, ls=ls, hatch=h,
+                     capstyle=path_capstyle(capstyle, ls, closed), joinstyle=joinstyle)
+
+    def roundpoly(self, arcs: Sequence[tuple[XY, float, float, float]],
+                  ends: Optional[tuple[XY, XY]] = None,
+                  color: str = 'black', fill: Optional[str] = None,
+                  lw: float = 2, ls: Linestyle = '-', hatch: bool = False,
+                  capstyle: Capstyle = 'round', joinstyle: Joinstyle = 'round',
+                  clip: Optional[BBox] = None, zorder: int = 1) -> None:
+        ''' Draw a polygon with rounded corners
+
+            Args:
+                arcs: (center, radius, theta1, theta2) of each corner, with
+                    angles in degrees. The arc is counterclockwise if theta2 > theta1.
+                    Corners are joined by straight lines.
+                ends: First and last points of an open path. The path
+                    is closed if None.
+        '''
+        verts: list[XY] = []
+        codes: list[int] = []
+        if ends is not None:
+            verts.append(ends[0])
+            codes.append(Path.MOVETO)
+        for center, radius, theta1, theta2 in arcs:
+            if theta2 >= theta1:
+                arc = Path.arc(theta1, theta2)
+                arcverts = arc.vertices
+            else:
+                arc = Path.arc(theta2, theta1)
+                arcverts = arc.vertices[::-1]
+            verts.extend((center[0] + radius*x, center[1] + radius*y) for x, y in arcverts)
+            codes.append(Path.LINETO if codes else Path.MOVETO)
+            codes.extend(arc.codes[1:])
+        if ends is None:
+            verts.append(verts[0])
+            codes.append(Path.CLOSEPOLY)
+        else:
+            verts.append(ends[1])
+            codes.append(Path.LINETO)
+
+        h = '///////' if hatch else None
+        self.addpath(Path(verts, codes), zorder, clip, edgecolor=color,
+                     facecolor='none' if fill is None else fill, lw=lw, ls=ls, hatch=h,
+                     capstyle=path_capstyle(capstyle, ls, ends is None), joinstyle=joinstyle)
 
     def circle(self, center: XY, radius: float, color: str = 'black', fill: Optional[str] = None,
                lw: float = 2, ls: Linestyle = '-', clip: Optional[BBox] = None, zorder: int = 1) -> None:
         ''' Draw a circle '''
-        circ = plt.Circle(xy=center, radius=radius, ec=color, fc=fill,
-                          fill=fill is not None, lw=lw, ls=ls, zorder=zorder)
-        self.ax.add_patch(circ)
-        self.addclip(circ, clip)
+        self.addpath(Path.circle(center, radius), zorder, clip, edgecolor=color,
+                     facecolor='none' if fill is None else fill, lw=lw, ls=ls,
+                     capstyle=path_capstyle('butt', ls, True))
 
     def arrow(self, xy: XY, theta: float,
               arrowwidth: float = .15, arrowlength: float = .25,
@@ -182,11 +423,8 @@ class Figure:
         fin1 = util.Point((fullen - arrowlength, arrowwidth/2)).rotate(theta) + tail
         fin2 = util.Point((fullen - arrowlength, -arrowwidth/2)).rotate(theta) + tail
 
-        p = plt.Polygon((fin1, head, fin2), closed=True, ec='none',
-                        fc=color, fill=color is not None,
-                        lw=lw, zorder=zorder)
-        self.ax.add_patch(p)
-        self.addclip(p, clip)
+        self.addpath(polygon_path((fin1, head, fin2)), zorder, clip, edgecolor='none',
+                     facecolor='none' if color is None else color, lw=lw)
 
     def bezier(self, p: Sequence[util.Point], color: str = 'black',
                lw: float = 2, ls: Linestyle = '-', capstyle: Capstyle = 'round', zorder: int = 1,
@@ -210,12 +448,8 @@ class Figure:
             codes = [Path.MOVETO, Path.CURVE4, Path.CURVE4, Path.CURVE4]
         else:
             codes = [Path.MOVETO, Path.CURVE3, Path.CURVE3]
-        curve = PathPatch(Path(lpoints, codes),
-                          fc='none', ec=color, ls=ls, lw=lw,
-                          capstyle=fix_capstyle(capstyle),
-                          transform=self.ax.transData)
-        self.ax.add_patch(curve)
-        self.addclip(curve, clip)
+        self.addpath(Path(lpoints, codes), zorder, clip, edgecolor=color, lw=lw, ls=ls,
+                     capstyle=fix_capstyle(capstyle))
 
         if arrow is not None:
             if '<' in arrow:
@@ -260,16 +494,9 @@ class Figure:
         if strcodes[-1] == 'Z':
             points.append((0, 0))  # Ingored point, but required by MPL
 
-        curve = PathPatch(Path(points, codes),
-                          fc='none' if fill is None else fill,
-                          ec=color, ls=ls, lw=lw,
-                          fill=(fill is not None),
-                          capstyle=fix_capstyle(capstyle),
-                          joinstyle=joinstyle,
-                          zorder=zorder,
-                          transform=self.ax.transData)
-        self.ax.add_patch(curve)
-        self.addclip(curve, clip)
+        self.addpath(Path(points, codes), zorder, clip, edgecolor=color,
+                     facecolor='none' if fill is None else fill, lw=lw, ls=ls,
+                     capstyle=fix_capstyle(capstyle), joinstyle=joinstyle)
 
     def arc(self, center: XY, width: float, height: float,
             theta1: float = 0, theta2: float = 90, angle: float = 0,
@@ -281,13 +508,14 @@ class Figure:
             arrowlength: float = .25
             ) -> None:
         ''' Draw an arc or ellipse, with optional arrowhead '''
-
+        self._flushzorder(zorder)
         if fill is None:
             arc = Arc(center, width=width, height=height, theta1=theta1,
                       theta2=theta2, angle=angle, color=color,
                       lw=lw, ls=ls, zorder=zorder)
             self.ax.add_patch(arc)
             self.addclip(arc, clip)
+            self.artists.append(arc)
         else:
             # Matplotlib doesn't support filled arcs, so make one using Polygon
             while theta1 > theta2:
@@ -308,6 +536,7 @@ class Figure:
 
             self.ax.add_patch(poly)
             self.addclip(poly, clip)
+            self.artists.append(poly)
 
         if arrow is not None:
             x, y = math.cos(math.radians(theta2)), math.sin(math.radians(theta2))
@@ -335,6 +564,7 @@ class Figure:
                               head_length=arrowlength,
                               color=color, zorder=zorder)
             self.addclip(a, clip)
+            self.artists.append(a)
 
     def image(self, image: str | BinaryIO, xy: XY, width: float, height: float,
               rotate: float = 0, zorder: int = 1, imgfmt: Optional[str] = None):
@@ -362,18 +592,51 @@ class Figure:
             raise ValueError('SVG images not supported in matplotlib backend') from ex
 
         tr = transforms.Affine2D().rotate_deg(rotate).translate(xy[0], xy[1])
+        self._flushzorder(zorder)
         im = self.ax.imshow(imdat, extent=(0, width, 0, height), zorder=zorder)
         im.set_transform(tr+self.ax.transData)
+        self.artists.append(im)
 
-    def save(self, fname: str, transparent: bool = True, dpi: float = 72) -> None:
+    def save(self, fname: str | BinaryIO, transparent: bool = True, dpi: float = 72) -> None:
         ''' Save the figure to a file '''
         fig = self.getfig()
         fig.subplots_adjust(0, 0, 1, 1)
-        fig.savefig(fname,
-                    bbox_inches='tight',
-                    transparent=transparent, dpi=dpi,
-                    bbox_extra_artists=self.ax.get_default_bbox_extra_artists(),
-                    pad_inches=0)
+        self._savefig(fname, transparent=transparent, dpi=dpi)
+
+    def _fixed_extent(self) -> bool:
+        ''' Whether the figure, sized from the drawing bbox, contains
+            everything drawn, so it can be saved without measuring
+            a tight bbox first. Only unclipped artists (text) can
+            extend beyond the axis.
+        '''
+        if self.userfig:
+            return False
+        unclipped = [a for a in self.ax.get_default_bbox_extra_artists() if not a.get_clip_on()]
+        if not unclipped:
+            return True
+        get_renderer = getattr(self.fig.canvas, 'get_renderer', None)
+        if get_renderer is None:
+            return False
+        renderer = get_renderer()
+        figbox = self.fig.bbox
+        for artist in unclipped:
+            extent = artist.get_tightbbox(renderer)
+            if extent is None:
+                continue
+            if (extent.x0 < figbox.x0 or extent.y0 < figbox.y0
+                    or extent.x1 > figbox.x1 or extent.y1 > figbox.y1):
+                return False
+        return True
+
+    def _savefig(self, fname: str | BinaryIO, **kwargs) -> None:
+        ''' Save with savefig, rendering once at the known figure size
+            if possible. Otherwise use a tight bbox, which renders twice.
+        '''
+        if not self._fixed_extent():
+            kwargs.update(bbox_inches='tight',
+                          bbox_extra_artists=self.ax.get_default_bbox_extra_artists(),
+                          pad_inches=0)
+        self.fig.savefig(fname, **kwargs)
 
     def getfig(self):
         ''' Get the Matplotlib figure '''
@@ -389,39 +652,90 @@ class Figure:
                  self.bbox.ymax+self.margin, self.bbox.ymin-self.margin,
                  self.bbox.ymin-self.margin),
                 color='black', lw=.5)
+        self.flush()
 
         if not self.userfig:
-            x1, x2 = self.bbox.xmin - self.margin, self.bbox.xmax + self.margin
-            y1, y2 = self.bbox.ymin - self.margin, self.bbox.ymax + self.margin
-            self.ax.set_xlim(x1, x2)
-            self.ax.set_ylim(y1, y2)
-            w = x2-x1
-            h = y2-y1
+            self._setlimits()
             self.ax.axes.get_xaxis().set_visible(False)
             self.ax.axes.get_yaxis().set_visible(False)
             self.ax.set_frame_on(False)
-            try:
-                self.ax.get_figure().set_size_inches(self.inches_per_unit*w,
-                                                     self.inches_per_unit*h)
-            except ValueError:
-                pass  # infinite size (no elements yet)
         return self.fig
 
+    def _setlimits(self) -> bool:
+        ''' Set axis limits and figure size from the bbox.
+            Returns True if they changed.
+        '''
+        x1, x2 = self.bbox.xmin - self.margin, self.bbox.xmax + self.margin
+        y1, y2 = self.bbox.ymin - self.margin, self.bbox.ymax + self.margin
+        changed = self.ax.get_xlim() != (x1, x2) or self.ax.get_ylim() != (y1, y2)
+        self.ax.set_xlim(x1, x2)
+        self.ax.set_ylim(y1, y2)
+        try:
+            self.ax.get_figure().set_size_inches(self.inches_per_unit*(x2-x1),
+                                                 self.inches_per_unit*(y2-y1))
+        except ValueError:
+            pass  # infinite size (no elements yet)
+        return changed
+
+    def refresh(self, artists: Optional[Sequence[Artist]] = None) -> None:
+        ''' Update the canvas after drawing, without saving an image.
+
+            If the limits are unchanged since the canvas was last
+            drawn and the canvas supports blitting, only `artists`
+            are drawn on top of it. Otherwise a redraw of the canvas
+            is requested with `draw_idle`, which GUI canvases
+            coalesce until the event loop runs.
+
+            Args:
+                artists: Artists added since the last refresh, or
+                    None to redraw everything.
+        '''
+        self.flush()
+        canvas = self.fig.canvas
+        if self._drawcid is None:
+            self._drawcid = canvas.mpl_connect('draw_event', self._on_draw)
+        changed = False if self.userfig else self._setlimits()
+        if changed or artists is None:
+            self._drawn = False
+        if self._drawn and canvas.supports_blit:
+            for artist in artists:  # type: ignore
+                self.ax.draw_artist(artist)
+            canvas.blit(self.fig.bbox)
+        else:
+            canvas.draw_idle()
+
+    def _on_draw(self, event) -> None:
+        ''' Canvas was drawn. New artists may be blitted onto it. '''
+        self._drawn = True
+
     def getimage(self, ext='svg'):
         ''' Get the image as SVG or PNG bytes array '''
-        fig = self.getfig()
+        self.getfig()
         output = BytesIO()
-        fig.savefig(output, format=ext,
-                    bbox_inches='tight',
-                    bbox_extra_artists=self.ax.get_default_bbox_extra_artists(),
-                    pad_inches=0)
-
+        self._savefig(output, format=ext)
         return output.getvalue()
 
     def clear(self) -> None:
         ''' Remove everything '''
+        self._batches = {}
+        self.artists = []
+        self._drawn = False
         self.ax.clear()
 
+    def release(self) -> None:
+        ''' Return a headless figure to the pool. The Figure
+            can't be used after releasing it.
+        '''
+        if self.headless:
+            self._batches = {}
+            self.artists = []
+            if self._drawcid is not None:
+                self.fig.canvas.mpl_disconnect(self._drawcid)
+                self._drawcid = None
+            figure_pool.release(self.fig, self.ax)
+            self.headless = False
+            self.fig = self.ax = None
+
     def __repr__(self):
         if plt.isinteractive():
             self.show()
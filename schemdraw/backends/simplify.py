@@ -0,0 +1,118 @@
+''' Simplify densely-sampled polylines before drawing them.
+
+    Points are removed with the Ramer-Douglas-Peucker algorithm
+    when they are within a tolerance (in drawing units) of the
+    simplified line, which also removes collinear and repeated points.
+'''
+
+from __future__ import annotations
+
+from typing import Sequence
+import math
+
+from ..types import XY
+
+
+def _farthest(x: Sequence[float], y: Sequence[float], first: int, last: int,
+              xarr=None, yarr=None) -> tuple[float, int]:
+    ''' Find the point between first and last farthest from the
+        line segment joining them. Long runs are searched with
+        numpy, when the coordinates are also given as arrays.
+
+        Returns:
+            distance, index
+    '''
+    ax, ay = x[first], y[first]
+    dx, dy = x[last] - ax, y[last] - ay
+    length2 = dx*dx + dy*dy
+    if xarr is not None and last - first > 64:
+        px = xarr[first+1:last] - ax
+        py = yarr[first+1:last] - ay
+        if length2 > 0:
+            t = ((px*dx + py*dy) / length2).clip(0., 1.)
+            px = px - t*dx
+            py = py - t*dy
+        dist2 = px*px + py*py
+        i = int(dist2.argmax())
+        return math.sqrt(dist2[i]), first+1+i
+
+    dmax, imax = 0., first
+    for i in range(first+1, last):
+        px, py = x[i] - ax, y[i] - ay
+        if length2 > 0:
+            t = (px*dx + py*dy) / length2
+            if t >= 1:
+                px, py = px - dx, py - dy
+            elif t > 0:
+                px, py = px - t*dx, py - t*dy
+        d = px*px + py*py
+        if d > dmax:
+            dmax, imax = d, i
+    return math.sqrt(dmax), imax
+
+
+def simplify(points: Sequence[XY], tolerance: float) -> list[XY]:
+    ''' Remove points that are within `tolerance` of the simplified
+        line. The first and last points are always kept.
+
+        Args:
+            points: Polyline vertices
+            tolerance: Maximum deviation from the original line.
+                Zero leaves the points unchanged.
+    '''
+    if tolerance <= 0 or len(points) < 3:
+        return list(points)
+
+    x = [float(p[0]) for p in points]
+    y = [float(p[1]) for p in points]
+    xarr = yarr = None
+    if len(points) > 64:
+        try:
+            # Imported here, not with schemdraw, to keep startup fast
+            import numpy as np  # type: ignore
+        except ImportError:
+            pass
+        else:
+            xarr, yarr = np.asarray(x), np.asarray(y)
+
+    keep = [False] * len(points)
+    keep[0] = keep[-1] = True
+    stack = [(0, len(points)-1)]
+    while stack:
+        first, last = stack.pop()
+        if last - first < 2:
+            continue
+        dmax, imax = _farthest(x, y, first, last, xarr, yarr)
+        if dmax > tolerance:
+            keep[imax] = True
+            stack.append((first, imax))
+            stack.append((imax, last))
+    return [p for p, k in zip(points, keep) if k]
+
+
+def simplify_xy(x: Sequence[float], y: Sequence[float],
+                tolerance: float) -> tuple[list[float], list[float]]:
+    ''' Simplify a polyline given as x and y lists. NaN coordinates
+        (gaps in the line) are kept, and each run of points between
+        them is simplified separately.
+    '''
+    if tolerance <= 0:
+        return list(x), list(y)
+
+    xout: list[float] = []
+    yout: list[float] = []
+    run: list[XY] = []
+    for xx, yy in zip(x, y):
+        if math.isnan(xx) or math.isnan(yy):
+            for p in simplify(run, tolerance):
+                xout.append(p[0])
+                yout.append(p[1])
+            xout.append(xx)
+            yout.append(yy)
+            run = []
+        else:
+            run.append((xx, yy))
+    for p in simplify(run, tolerance):
+        xout.append(p[0])
+        yout.append(p[1])
+    return xout, yout
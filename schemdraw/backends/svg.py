@@ -2,7 +2,8 @@
 
 from __future__ import annotations
 
-from typing import Sequence, Optional, BinaryIO
+from typing import Any, Callable, Iterator, Sequence, Optional, BinaryIO, NamedTuple
+from collections import OrderedDict
 from xml.etree import ElementTree as ET
 
 import os
@@ -11,6 +12,9 @@ import subprocess
 import tempfile
 import math
 import base64
+import copy
+import threading
+import hashlib
 
 try:
     import ziamath  # type: ignore
@@ -19,7 +23,10 @@ except ImportError:
 
 from ..types import Capstyle, Joinstyle, Linestyle, BBox, Halign, Valign, RotationMode, TextMode, XY, Gradient
 from ..util import Point
+from ..transform import Transform
 from . import svgtext
+from .svgpath import polyline_data, points_data, relative_path_data
+from .simplify import simplify, simplify_xy
 from .svgunits import parse_size_to_px, PT_PER_IN
 
 precision = 3
@@ -40,6 +47,9 @@ class Config:
     ''' Configuration options for SVG backend '''
     _text: TextMode = 'path' if ziamath is not None else 'text'
     _batik: bool = False
+    _instances: bool = False
+    _styleclasses: bool = False
+    _markers: bool = False
 
     @property
     def text(self) -> TextMode:
@@ -95,12 +105,70 @@ class Config:
     def useBatik(self, value: bool) -> None:
         self._batik = value
 
+    @property
+    def instances(self) -> bool:
+        ''' Draw elements with the same geometry and style once as
+            a <symbol>, and place each element with <use>. Reduces
+            the size of drawings with many identical elements.
+        '''
+        return self._instances
+
+    @instances.setter
+    def instances(self, value: bool) -> None:
+        self._instances = value
+
+    @property
+    def styleclasses(self) -> bool:
+        ''' Write each unique style once, as a class in a <style>
+            block, instead of in every element's style attribute.
+            Class names are hashes of the style, so figures placed
+            in one HTML page only share classes with identical styles.
+        '''
+        return self._styleclasses
+
+    @styleclasses.setter
+    def styleclasses(self, value: bool) -> None:
+        self._styleclasses = value
+
+    @property
+    def markers(self) -> bool:
+        ''' Draw arrowheads and filled dots once for each size and
+            color as a <symbol>, and place each one with <use>.
+        '''
+        return self._markers
+
+    @markers.setter
+    def markers(self, value: bool) -> None:
+        self._markers = value
+
 
 config = Config()
 
 
-hatchpattern = '''<defs><pattern id="hatch" patternUnits="userSpaceOnUse" width="4" height="4">
-<path d="M-1,1 l2,-2 M0,4 l4,-4 M3,5 l2,-2" style="stroke:black; stroke-width:.5" /></pattern></defs>'''
+hatchpattern = '''<pattern id="hatch" patternUnits="userSpaceOnUse" width="4" height="4">
+<path d="M-1,1 l2,-2 M0,4 l4,-4 M3,5 l2,-2" style="stroke:black; stroke-width:.5" /></pattern>'''
+
+
+def _freeze(value):
+    ''' Convert drawing call arguments into a hashable key '''
+    if isinstance(value, (list, tuple)):
+        return tuple(_freeze(v) for v in value)
+    elif isinstance(value, dict):
+        return tuple((k, _freeze(v)) for k, v in sorted(value.items()))
+    elif isinstance(value, float) and math.isnan(value):
+        return None  # NaN != NaN would never match
+    return value
+
+
+class _Recorder:
+    ''' Stand-in Figure that records the drawing calls made by segments '''
+    def __init__(self):
+        self.calls: list[tuple[str, tuple, dict]] = []
+
+    def __getattr__(self, name: str):
+        def record(*args, **kwargs):
+            self.calls.append((name, args, kwargs))
+        return record
 
 
 def isnotebook():
@@ -118,9 +186,27 @@ inline = isnotebook()
 def getstyle(color: Optional[str] = None, ls: Optional[Linestyle] = None, lw: Optional[float] = None,
              capstyle: Optional[Capstyle] = None, joinstyle: Optional[Joinstyle] = None,
              fill: Optional[str] = None, hatch: bool = False) -> str:
-    ''' Get style for svg element. Leave empty if property matches default '''
-    # Note: styles are added to every SVG element, rather than in a global <style>
-    # tag, since multiple images in one HTML page may share <styles>.
+    ''' Get style for svg element. Leave empty if property matches default.
+        Results are cached in `style_cache`.
+    '''
+    # Note: by default styles are added to every SVG element, rather than in a
+    # global <style> tag, since multiple images in one HTML page may share <styles>.
+    # See config.styleclasses.
+    key = (color, ls, lw, capstyle, joinstyle, fill, hatch)
+    try:
+        style = style_cache.get(key)
+    except TypeError:  # Unhashable color
+        return _getstyle(*key)
+    if style is None:
+        style = _getstyle(*key)
+        style_cache.put(key, style)
+    return style
+
+
+def _getstyle(color: Optional[str], ls: Optional[Linestyle], lw: Optional[float],
+              capstyle: Optional[Capstyle], joinstyle: Optional[Joinstyle],
+              fill: Optional[str], hatch: bool) -> str:
+    ''' Build style string without caching '''
     s = ''
     if isinstance(color, tuple):
         s += f'stroke:rgb({int(color[0]*255)},{int(color[1]*255)},{int(color[2]*255)});'
@@ -151,13 +237,84 @@ def getstyle(color: Optional[str] = None, ls: Optional[Linestyle] = None, lw: Op
     return s
 
 
+class CacheInfo(NamedTuple):
+    ''' Cache statistics '''
+    hits: int
+    misses: int
+    maxsize: int
+    currsize: int
+
+
+class LRUCache:
+    ''' Bounded, thread-safe least-recently-used cache
+
+        Args:
+            maxsize: Maximum number of entries. 0 disables caching.
+    '''
+    def __init__(self, maxsize: int = 2048):
+        self._cache: OrderedDict[tuple, Any] = OrderedDict()
+        self._lock = threading.Lock()
+        self._maxsize = maxsize
+        self.hits = 0
+        self.misses = 0
+
+    @property
+    def maxsize(self) -> int:
+        ''' Maximum number of cached entries '''
+        return self._maxsize
+
+    @maxsize.setter
+    def maxsize(self, value: int) -> None:
+        with self._lock:
+            self._maxsize = max(0, value)
+            while len(self._cache) > self._maxsize:
+                self._cache.popitem(last=False)
+
+    def get(self, key: tuple) -> Any:
+        ''' Get cached value, or None if not cached '''
+        with self._lock:
+            value = self._cache.get(key)
+            if value is None:
+                self.misses += 1
+            else:
+                self.hits += 1
+                self._cache.move_to_end(key)
+            return value
+
+    def put(self, key: tuple, value: Any) -> None:
+        ''' Add a value to the cache '''
+        with self._lock:
+            if self._maxsize > 0:
+                self._cache[key] = value
+                self._cache.move_to_end(key)
+                if len(self._cache) > self._maxsize:
+                    self._cache.popitem(last=False)
+
+    def clear(self) -> None:
+        ''' Remove all entries and reset statistics '''
+        with self._lock:
+            self._cache.clear()
+            self.hits = 0
+            self.misses = 0
+
+    def info(self) -> CacheInfo:
+        ''' Get cache statistics '''
+        with self._lock:
+            return CacheInfo(self.hits, self.misses, self._maxsize, len(self._cache))
+
+
+text_cache = LRUCache()  # Text sizes
+text_fragment_cache = LRUCache(512)  # Path-mode text rendered at the origin
+style_cache = LRUCache(256)  # Style strings
+
+
 def text_size(text: str,
               font: Optional[str] = 'sans',
               mathfont: Optional[str] = None,
               size: float = 14) -> tuple[float, float, float]:
     ''' Get size of text. Size will be exact bounding box if ziamath installed and
         using path text mode. Otherwise size will be estimated based on character
-        widths.
+        widths. Results are cached in `text_cache`.
 
         Args:
             text: string to calculate
@@ -170,6 +327,16 @@ def text_size(text: str,
     if font is None or font.lower() in ['sans-serif', 'Arial']:
         font = 'sans'
 
+    key = (text, font, mathfont, size, config.text)
+    textsize = text_cache.get(key)
+    if textsize is None:
+        textsize = _text_size(text, font, mathfont, size)
+        text_cache.put(key, textsize)
+    return textsize
+
+
+def _text_size(text: str, font: str, mathfont: Optional[str], size: float) -> tuple[float, float, float]:
+    ''' Calculate size of text without caching '''
     if (ziamath and
         (mathfont is None or os.path.exists(mathfont))):
         if text == '':
@@ -188,23 +355,26 @@ class Figure:
             bbox: Coordinate bounding box for drawing
             inches_per_unit: Scale for the drawing
             showbbox: Show frame around entire drawing
+            simplify: Tolerance, in drawing units, for removing
+                points from polylines and polygons. Zero disables.
     '''
-    # Keep track of clipid's across all figures so they don't conflict
-    # when multiple figures are in one Jupyter notebook/html file.
-    total_clips = 0
-
     def __init__(self, bbox: BBox, **kwargs):
         self.svgelements: list[tuple[int, ET.Element]] = []  # (zorder, element)
-        self.clips: dict[BBox, int] = {}
+        self.clips: dict[BBox, str] = {}  # Clip path ids by bbox
         self.showbbox = kwargs.get('showbbox', False)
+        self.simplify = kwargs.get('simplify', 0) or 0
         self.scale = PT_PER_IN * kwargs.get('inches_per_unit', 0.5)   # Converts drawing units to points
         self.margin = kwargs.get('margin', 0.1) + LINE_WIDTH/PT_PER_IN  # Margin in drawing units. Add line width (2pt) to include linecaps in bbox
         self.set_bbox(bbox)
         self._bgcolor: Optional[str] = None
         self._need_xlink = False
         self.svgcanvas = kwargs.get('svg')
-        self.svgdefs: list[str] = []
-        self.gradients: dict[str, Gradient] = {}
+        self.svgdefs: list[str] = []  # User-supplied defs
+        self.defs: dict[str, ET.Element] = {}  # Definitions by content hash
+        self.glyphs: dict[str, ET.Element] = {}  # Glyph <symbol>s by id, shared by all text
+        self.instances: dict[tuple, list[tuple[int, str]]] = {}  # Drawing calls: (zorder, symbol id)
+        self.markers: dict[tuple, str] = {}  # Marker symbol ids by shape and style
+        self.styles: dict[str, str] = {}  # Class names by style string
 
     def set_bbox(self, bbox: BBox) -> None:
         ''' Set the bounding box '''
@@ -227,31 +397,147 @@ class Figure:
         ''' Set background color of drawing '''
         self._bgcolor = color
 
+    def adddef(self, content: str | bytes, prefix: str = 'def',
+               element: Optional[Callable[[], ET.Element]] = None) -> str:
+        ''' Add a definition to <defs>, once for each unique content.
+
+            Args:
+                content: XML of the definition, or bytes identifying
+                    it if `element` is provided
+                prefix: Prefix for the definition id
+                element: Function to build the definition element,
+                    only called if the content was not already added
+
+            Returns:
+                Definition id. The id is made from the content hash,
+                unless the definition element has its own id.
+        '''
+        if isinstance(content, str):
+            content = content.encode()
+        key = hashlib.sha1(content).hexdigest()[:10]
+        et = self.defs.get(key)
+        if et is None:
+            et = element() if element is not None else ET.fromstring(content)
+            if et.get('id') is None:
+                et.set('id', f'{prefix}{key}')
+            self.defs[key] = et
+        return et.get('id', '')
+
     def add_gradient(self, gradient: Gradient) -> str:
         ''' Add to gradients and return id '''
-        if gradient in self.gradients.values():
-            gradid = {v: k for k, v in self.gradients.items()}[gradient]
-        else:
-            gradid = f'grad{len(self.gradients)}'
-            self.gradients[gradid] = gradient
+        c1, c2, vert = gradient
+        gradid = self.adddef(
+            f'''<linearGradient x1="0" x2="{0 if vert else 1}" y1="0" y2="{1 if vert else 0}">'''
+            f'''<stop offset="0%" stop-color="{c1}" />'''
+            f'''<stop offset="100%" stop-color="{c2}"/></linearGradient>''', 'grad')
         return f'url(#{gradid})'
 
+    def setstyle(self, et: ET.Element, style: str) -> None:
+        ''' Set the element style, as a shared class if enabled.
+            Class names are made from the style hash so they don't
+            conflict between figures placed in one HTML page.
+        '''
+        if config.styleclasses:
+            cls = self.styles.get(style)
+            if cls is None:
+                cls = 's' + hashlib.sha1(style.encode()).hexdigest()[:10]
+                self.styles[style] = cls
+            et.set('class', cls)
+        else:
+            et.set('style', style)
+
     def addclip(self, et: ET.Element, bbox: Optional[BBox]):
         ''' Add clip path to the element '''
         if bbox is not None:
-            if bbox in self.clips:
-                clipid = self.clips[bbox]
-            else:
-                clipid = Figure.total_clips
-                Figure.total_clips += 1
-                self.clips[bbox] = clipid
-
+            clipid = self.clips.get(bbox)
+            if clipid is None:
                 x0, y0 = self.xform(bbox.xmin, bbox.ymin)
                 x1, y1 = self.xform(bbox.xmax, bbox.ymax)
-                clip = ET.fromstring(f'''<defs><clipPath id="clip{clipid}"><rect x="{x0-1}" y="{y0-1}"'''
-                                     f''' width="{fmt(x1-x0+2)}" height="{fmt(y1-y0+2)}" /></clipPath></defs>''')
-                self.svgelements.append((0, clip))
-            et.set('clip-path', f'url(#clip{clipid})')
+                clipid = self.adddef(f'''<clipPath><rect x="{x0-1}" y="{y0-1}"'''
+                                     f''' width="{fmt(x1-x0+2)}" height="{fmt(y1-y0+2)}" /></clipPath>''',
+                                     'clip')
+                self.clips[bbox] = clipid
+            et.set('clip-path', f'url(#{clipid})')
+
+    @property
+    def instancing(self) -> bool:
+        ''' Elements may be drawn with draw_instance '''
+        return config.instances
+
+    def draw_instance(self, segments: Sequence, transform: Transform, style: dict) -> bool:
+        ''' Draw segments as <use> references to <symbol>s shared by
+            every element with the same local geometry and style.
+
+            Args:
+                segments: Segments to draw, in element coordinates
+                transform: Element transform
+                style: Resolved element parameters
+
+            Returns:
+                False if the segments can't be instanced. Nothing
+                is drawn in this case.
+        '''
+        # Rotation and translation go on the <use>. Zoom and local
+        # shift are drawn into the symbol so line widths don't scale.
+        local = Transform(0, (0, 0), transform.localshift, transform.zoom)
+        recorder = _Recorder()
+        for segment in segments:
+            segment.draw(recorder, local, **style)
+
+        if any(kwargs.get('clip') is not None for _, _, kwargs in recorder.calls):
+            return False  # Clip boxes are in drawing coordinates
+        try:
+            key = _freeze(recorder.calls)
+            uses = self.instances.get(key)
+        except TypeError:
+            return False
+
+        if uses is None:
+            elements, self.svgelements = self.svgelements, []
+            for name, args, kwargs in recorder.calls:
+                getattr(self, name)(*args, **kwargs)
+            drawn, self.svgelements = self.svgelements, elements
+
+            # One symbol for each zorder so the element still
+            # interleaves with others in the right order
+            layers: dict[int, list[ET.Element]] = {}
+            for zorder, et in drawn:
+                layers.setdefault(zorder, []).append(et)
+            uses = [(zorder, self._symbol(ets, 'elm')) for zorder, ets in layers.items()]
+            self.instances[key] = uses
+
+        x, y = self.xform(*transform.shift)
+        xform = f'translate({fmt(x)} {fmt(y)})'
+        if transform.theta % 360:
+            xform += f' rotate({fmt(-transform.theta)})'
+        for zorder, symid in uses:
+            self.svgelements.append((zorder, self._use(symid, xform)))
+        return True
+
+    def _use(self, symid: str, xform: str) -> ET.Element:
+        ''' Create a <use> tag referencing symbol id '''
+        et = ET.Element('use')
+        if config.svg2:
+            et.set('href', f'#{symid}')
+        else:
+            et.set('xlink:href', f'#{symid}')
+            self._need_xlink = True
+        et.set('transform', xform)
+        return et
+
+    def _symbol(self, elements: Sequence[ET.Element], prefix: str) -> str:
+        ''' Define a <symbol> holding the elements, once for each
+            unique content, and return its id
+        '''
+        symbol = ET.Element('symbol', overflow='visible')
+        symbol.extend(elements)
+        return self.adddef(ET.tostring(symbol), prefix, lambda: symbol)
+
+    def _marker(self, key: tuple, et: ET.Element) -> str:
+        ''' Define a marker <symbol> drawn by element et, and return its id '''
+        symid = self._symbol([et], 'mkr')
+        self.markers[key] = symid
+        return symid
 
     def plot(self, x: XY, y: XY,
              color: str = 'black', ls: Linestyle = '-', lw: float = 2,
@@ -259,20 +545,13 @@ class Figure:
              joinstyle: Joinstyle = 'round', clip: Optional[BBox] = None, zorder: int = 2) -> None:
         ''' Plot a path '''
         et = ET.Element('path')
-        d = 'M {},{} '.format(*self.xform(x[0], y[0]))
-        for xx, yy in zip(x[1:], y[1:]):
-            if str(xx) == 'nan' or str(yy) == 'nan':
-                d += 'M '
-                continue
-            elif not d.endswith('M '):
-                d += 'L '
-            xx, yy = self.xform(xx, yy)
-            d += f'{fmt(xx)},{fmt(yy)} '
-
-        d = d.strip()
-        et.set('d', d)
-        et.set('style', getstyle(color=color, ls=ls, lw=lw, capstyle=capstyle,
-                                 joinstyle=joinstyle, fill=fill))
+        if self.simplify > 0:
+            x, y = simplify_xy(x, y, self.simplify)
+            et.set('d', relative_path_data(x, y, self.scale, precision))
+        else:
+            et.set('d', polyline_data(x, y, self.scale, precision))
+        self.setstyle(et, getstyle(color=color, ls=ls, lw=lw, capstyle=capstyle,
+                                   joinstyle=joinstyle, fill=fill))
         self.addclip(et, clip)
         self.svgelements.append((zorder, et))
 
@@ -327,11 +606,18 @@ class Figure:
 
         if ziamath and config.text == 'path':
             texttag = ET.Element('g')
-            ztext = ziamath.Text(s, textfont=fontfamily, mathfont=mathfont,
-                                 size=fontsize, linespacing=1, color=color,
-                                 rotation=rotation, rotation_mode=rotation_mode)
-            ztext.drawon(texttag, x0, y0,
-                         halign=halign, valign=valign)
+            textgroup, glyphs = self._text_fragment(s, fontsize, fontfamily, mathfont, color,
+                                                    rotation, rotation_mode, halign, valign)
+            # Copy so changes to this figure's tree don't reach the cache
+            self.glyphs.update((k, copy.deepcopy(v)) for k, v in glyphs.items()
+                               if k not in self.glyphs)
+            for fragment in textgroup:
+                # Fragment is positioned at the origin; shift it into place
+                fragment = copy.deepcopy(fragment)
+                xform = fragment.get('transform')
+                translate = f'translate({fmt(x0)} {fmt(y0)})'
+                fragment.set('transform', f'{translate} {xform}' if xform else translate)
+                texttag.append(fragment)
         else:
             texttag = svgtext.text_tosvg(s, x0, y0, font=fontfamily, size=fontsize,
                                          halign=halign, valign=valign, color=color,
@@ -342,23 +628,100 @@ class Figure:
         self.addclip(texttag, clip)
         self.svgelements.append((zorder, texttag))
 
+    @staticmethod
+    def _text_fragment(s: str, fontsize: float, fontfamily: str, mathfont: Optional[str],
+                       color: str, rotation: float, rotation_mode: RotationMode,
+                       halign: Halign, valign: Valign) -> tuple[ET.Element, dict[str, ET.Element]]:
+        ''' Get path-mode text drawn at the origin, from the fragment
+            cache if the same text and style was already drawn.
+            The returned elements must not be modified.
+
+            Returns:
+                Text group, and glyph <symbol> elements (SVG2 only)
+                referenced by the text's <use> tags, by id
+        '''
+        key = (s, fontsize, fontfamily, mathfont, color, rotation, rotation_mode,
+               halign, valign, config.svg2, config.precision)
+        try:
+            cached = text_fragment_cache.get(key)
+        except TypeError:  # Unhashable color
+            key, cached = None, None
+        if cached is None:
+            fragment = ET.Element('g')
+            ztext = ziamath.Text(s, textfont=fontfamily, mathfont=mathfont,
+                                 size=fontsize, linespacing=1, color=color,
+                                 rotation=rotation, rotation_mode=rotation_mode)
+            ztext.drawon(fragment, 0, 0, halign=halign, valign=valign)
+
+            # Pull out the glyph symbols so each is only emitted
+            # once per figure, in <defs>
+            glyphs = {}
+            for parent in fragment.iter():
+                for child in list(parent):
+                    if child.tag == 'symbol':
+                        parent.remove(child)
+                        glyphs[child.get('id', '')] = child
+            if key is not None:
+                text_fragment_cache.put(key, (fragment, glyphs))
+            return fragment, glyphs
+        return cached
+
     def poly(self, verts: Sequence[XY], closed: bool = True,
              color: str = 'black', fill: str = 'none', lw: float = 2,
              ls: Linestyle = '-', hatch: bool = False, capstyle: Capstyle = 'round',
              joinstyle: Joinstyle = 'round', clip: Optional[BBox] = None, zorder: int = 1) -> None:
         ''' Draw a polygon '''
         et = ET.Element('polyline') if not closed else ET.Element('polygon')
-        points = ''
-        for xx, yy in verts:
-            xx, yy = self.xform(xx, yy)
-            points += f'{fmt(xx)},{fmt(yy)} '
-        et.set('points', points)
-        et.set('style', getstyle(color=color, ls=ls, lw=lw, capstyle=capstyle,
-                                 joinstyle=joinstyle, fill=fill, hatch=hatch))
+        if self.simplify > 0:
+            verts = simplify(verts, self.simplify)
+        et.set('points', points_data(verts, self.scale, precision))
+        self.setstyle(et, getstyle(color=color, ls=ls, lw=lw, capstyle=capstyle,
+                                   joinstyle=joinstyle, fill=fill, hatch=hatch))
+        self.addclip(et, clip)
+        self.svgelements.append((zorder, et))
+        if hatch:
+            self.adddef(hatchpattern)
+
+    def roundpoly(self, arcs: Sequence[tuple[XY, float, float, float]],
+                  ends: Optional[tuple[XY, XY]] = None,
+                  color: str = 'black', fill: str = 'none', lw: float = 2,
+                  ls: Linestyle = '-', hatch: bool = False, capstyle: Capstyle = 'round',
+                  joinstyle: Joinstyle = 'round', clip: Optional[BBox] = None, zorder: int = 1) -> None:
+        ''' Draw a polygon with rounded corners
+
+            Args:
+                arcs: (center, radius, theta1, theta2) of each corner, with
+                    angles in degrees. The arc is counterclockwise if theta2 > theta1.
+                    Corners are joined by straight lines.
+                ends: First and last points of an open path. The path
+                    is closed if None.
+        '''
+        d = []
+        if ends is not None:
+            x, y = self.xform(*ends[0])
+            d.append(f'M {fmt(x)},{fmt(y)}')
+        for center, radius, theta1, theta2 in arcs:
+            th1, th2 = math.radians(theta1), math.radians(theta2)
+            x1, y1 = self.xform(center[0] + radius*math.cos(th1), center[1] + radius*math.sin(th1))
+            x2, y2 = self.xform(center[0] + radius*math.cos(th2), center[1] + radius*math.sin(th2))
+            r = fmt(radius*self.scale)
+            large = 1 if abs(theta2 - theta1) > 180 else 0
+            sweep = 1 if theta2 < theta1 else 0  # SVG's y is flipped
+            d.append(f'{"L" if d else "M"} {fmt(x1)},{fmt(y1)}')
+            d.append(f'A {r} {r} 0 {large} {sweep} {fmt(x2)},{fmt(y2)}')
+        if ends is None:
+            d.append('Z')
+        else:
+            x, y = self.xform(*ends[1])
+            d.append(f'L {fmt(x)},{fmt(y)}')
+        et = ET.Element('path')
+        et.set('d', ' '.join(d))
+        self.setstyle(et, getstyle(color=color, ls=ls, lw=lw, capstyle=capstyle,
+                                   joinstyle=joinstyle, fill=fill, hatch=hatch))
         self.addclip(et, clip)
         self.svgelements.append((zorder, et))
         if hatch:
-            self.svgdefs.append(hatchpattern)
+            self.adddef(hatchpattern)
 
     def circle(self, center: XY, radius: float, color: str = 'black',
                fill: str = 'none', lw: float = 2, ls: Linestyle = '-',
@@ -366,11 +729,22 @@ class Figure:
         ''' Draw a circle '''
         x, y = self.xform(*center)
         radius = radius * self.scale
+        if config.markers and fill not in [None, 'none'] and clip is None:
+            key = ('circle', fmt(radius), color, fill, lw, ls)
+            symid = self.markers.get(key)
+            if symid is None:
+                et = ET.Element('circle')
+                et.set('r', fmt(radius))
+                self.setstyle(et, getstyle(color=color, lw=lw, ls=ls, fill=fill))
+                symid = self._marker(key, et)
+            self.svgelements.append((zorder, self._use(symid, f'translate({fmt(x)} {fmt(y)})')))
+            return
+
         et = ET.Element('circle')
         et.set('cx', fmt(x))
         et.set('cy', fmt(y))
         et.set('r', fmt(radius))
-        et.set('style', getstyle(color=color, lw=lw, ls=ls, fill=fill))
+        self.setstyle(et, getstyle(color=color, lw=lw, ls=ls, fill=fill))
         self.addclip(et, clip)
         self.svgelements.append((zorder, et))
 
@@ -379,6 +753,24 @@ class Figure:
               color: str = 'black', lw: float = 2, clip: Optional[BBox] = None, zorder: int = 1) -> None:
         ''' Draw an arrowhead '''
         x, y = self.xform(*xy)
+        if config.markers and clip is None:
+            # Arrowhead pointing along +x with its tip at the origin
+            key = ('arrow', arrowwidth, arrowlength, color, lw)
+            symid = self.markers.get(key)
+            if symid is None:
+                length = arrowlength*self.scale
+                halfwidth = fmt(arrowwidth*self.scale/2)
+                et = ET.Element('path')
+                et.set('d', f'M {fmt(-lw*2)} 0 L {fmt(-length)} {halfwidth} L {fmt(-length)} -{halfwidth} Z')
+                self.setstyle(et, getstyle(color=color, lw=0, capstyle='butt',
+                                           joinstyle='miter', fill=color))
+                symid = self._marker(key, et)
+            xform = f'translate({fmt(x)} {fmt(y)})'
+            if theta % 360:
+                xform += f' rotate({fmt(-theta)})'
+            self.svgelements.append((zorder, self._use(symid, xform)))
+            return
+
         dx = arrowlength/2 * math.cos(math.radians(theta)) * self.scale
         dy = arrowlength/2 * math.sin(math.radians(theta)) * self.scale
         arrowwidth = arrowwidth*self.scale
@@ -402,8 +794,8 @@ class Figure:
         d += f'L {fmt(fin1[0])} {fmt(fin1[1])} '
         d += f'L {fmt(fin2[0])} {fmt(fin2[1])} Z'
         et1.set('d', d)
-        et1.set('style', getstyle(color=color, lw=0, capstyle='butt',
-                                  joinstyle='miter', fill=color))
+        self.setstyle(et1, getstyle(color=color, lw=0, capstyle='butt',
+                                    joinstyle='miter', fill=color))
         self.addclip(et1, clip)
         self.svgelements.append((zorder, et1))
 
@@ -432,7 +824,7 @@ class Figure:
         for p0 in lpoints[1:]:
             path += f' {fmt(p0[0])} {fmt(p0[1])}'
         et.set('d', path)
-        et.set('style', getstyle(color=color, ls=ls, lw=lw, capstyle=capstyle))
+        self.setstyle(et, getstyle(color=color, ls=ls, lw=lw, capstyle=capstyle))
         self.addclip(et, clip)
         self.svgelements.append((zorder, et))
 
@@ -473,8 +865,8 @@ class Figure:
                 dstrs.append(f'{fmt(y)}')
         et = ET.Element('path')
         et.set('d', ' '.join(dstrs))
-        et.set('style', getstyle(color=color, ls=ls, lw=lw, capstyle=capstyle,
-                                 joinstyle=joinstyle, fill=fill))
+        self.setstyle(et, getstyle(color=color, ls=ls, lw=lw, capstyle=capstyle,
+                                   joinstyle=joinstyle, fill=fill))
         self.addclip(et, clip)
         self.svgelements.append((zorder, et))
 
@@ -525,7 +917,7 @@ class Figure:
             et.set('ry', fmt(height/2))
             if angle != 0:
                 et.set('transform', f'rotate({fmt(angle)} {fmt(centerx)} {fmt(centery)})')
-            et.set('style', getstyle(color=color, ls=ls, lw=lw, fill=fill))
+            self.setstyle(et, getstyle(color=color, ls=ls, lw=lw, fill=fill))
             self.addclip(et, clip)
             self.svgelements.append((zorder, et))
 
@@ -535,7 +927,7 @@ class Figure:
             d = f'M {fmt(startx)} {fmt(starty)}'
             d += f' a {fmt(width/2)} {fmt(height/2)} {fmt(angle)} {flags} {fmt(dx)} {fmt(dy)}'
             et.set('d', d)
-            et.set('style', getstyle(color=color, ls=ls, lw=lw, fill=fill))
+            self.setstyle(et, getstyle(color=color, ls=ls, lw=lw, fill=fill))
             self.addclip(et, clip)
             self.svgelements.append((zorder, et))
 
@@ -616,45 +1008,90 @@ class Figure:
             et.set('transform', xform)
             et.append(imageelm)
         else:  # Raster images
-            image_b64 = base64.encodebytes(imgdat).decode()
-            et = ET.Element('image')
-            et.set('xlink:href', f'data:image/{imgfmt};base64,{image_b64}')
+            def element() -> ET.Element:
+                image_b64 = base64.encodebytes(imgdat).decode()
+                imageelm = ET.Element('image')
+                imageelm.set('xlink:href', f'data:image/{imgfmt};base64,{image_b64}')
+                imageelm.set('width', fmt(width))
+                imageelm.set('height', fmt(height))
+                return imageelm
+
+            # Image data is embedded once, and placed with <use>
             self._need_xlink = True
-
-            et.set('x', fmt(x0))
-            et.set('y', fmt(y0))
-            et.set('width', fmt(width))
-            et.set('height', fmt(height))
+            imgid = self.adddef(imgdat + f'{imgfmt} {fmt(width)} {fmt(height)}'.encode(), 'img', element)
+            xform = f'translate({fmt(x0)} {fmt(y0)})'
             if rotate:
-                et.set('transform', f'rotate({-rotate} {x0} {y0+height})')
+                xform = f'rotate({-rotate} {x0} {y0+height}) ' + xform
+            et = self._use(imgid, xform)
         self.svgelements.append((zorder, et))
 
-    def save(self, fname: str, **kwargs) -> None:
-        ''' Save the figure to a file '''
-        svg = self.getimage().decode()
+    def save(self, fname: str | os.PathLike | BinaryIO, **kwargs) -> None:
+        ''' Save the figure to a file name or binary stream '''
+        if not isinstance(fname, (str, os.PathLike)):
+            self.write(fname)
+            return
+
         ext = os.path.splitext(fname)[1]
         if ext.lower() != '.svg':
             raise ValueError('SVG backend only supports saving SVG format figures.')
-        with open(fname, 'w', encoding='utf-8') as f:
-            f.write(svg)
+        with open(fname, 'wb') as f:
+            self.write(f)
 
-    def _svg_defs(self, svg) -> None:
-        if self.gradients or self.svgdefs:
-            defstr = '<defs>'
-            defstr += ''.join(self.svgdefs)
-
-            for gradid, (c1, c2, vert) in self.gradients.items():
-                gradstr = f'''
-                    <linearGradient id="{gradid}" x1="0" x2="{0 if vert else 1}" y1="0" y2="{1 if vert else 0}">
-                    <stop offset="0%" stop-color="{c1}" />
-                    <stop offset="100%" stop-color="{c2}"/>
-                    </linearGradient>'''
-                defstr += gradstr
-            defstr += '</defs>'
-            svg.append(ET.fromstring(defstr))
+    def write(self, stream: BinaryIO) -> None:
+        ''' Write the SVG to a binary stream. Drawing elements are
+            serialized one at a time, so the full XML document is
+            never held in memory. Output is the same as getimage().
+        '''
+        svg = self._svgroot()
+        children = list(svg) + list(self._zordered())
+
+        # Namespaces of the whole document are all declared
+        # on the root tag, the same as ET.tostring
+        doc = ET.Element(svg.tag, svg.attrib)
+        doc.text = svg.text
+        doc.extend(children)
+        qnames, namespaces = ET._namespaces(doc)  # type: ignore
+
+        def serialize(elm: ET.Element, namespaces=None, short_empty_elements=True) -> bytes:
+            chunks: list[str] = []
+            ET._serialize_xml(chunks.append, elm, qnames, namespaces,  # type: ignore
+                              short_empty_elements=short_empty_elements)
+            return ''.join(chunks).encode('utf-8', 'xmlcharrefreplace')
+
+        if not children:
+            stream.write(serialize(doc, namespaces))
+            return
 
-    def getsvg(self) -> ET.Element:
-        ''' Get the image as SVG XML Tree '''
+        root = ET.Element(svg.tag, svg.attrib)
+        root.text = svg.text
+        closetag = f'</{qnames[svg.tag]}>'.encode()
+        stream.write(serialize(root, namespaces, short_empty_elements=False)[:-len(closetag)])
+        for elm in children:
+            stream.write(serialize(elm))
+        stream.write(closetag)
+
+    def _svg_defs(self, svg) -> None:
+        if self.defs or self.svgdefs or self.glyphs or self.styles:
+            defs = ET.fromstring('<defs>' + ''.join(self.svgdefs) + '</defs>')
+            defs.extend(self.defs.values())
+            if self.styles:
+                style = ET.SubElement(defs, 'style')
+                style.text = ''.join(f'.{cls}{{{s}}}' for s, cls in self.styles.items())
+            defs.extend(self.glyphs.values())
+            svg.append(defs)
+
+    def _zordered(self) -> Iterator[ET.Element]:
+        ''' Iterate drawing elements, by zorder layer, in the
+            order they were drawn within each layer
+        '''
+        layers: dict[int, list[ET.Element]] = {}
+        for zorder, elm in self.svgelements:
+            layers.setdefault(zorder, []).append(elm)
+        for zorder in sorted(layers):
+            yield from layers[zorder]
+
+    def _svgroot(self) -> ET.Element:
+        ''' Get the <svg> element with defs, without drawing elements '''
         x0 = self.bbox.xmin * self.scale
         y0 = -self.bbox.ymax * self.scale
         if not self.svgcanvas:
@@ -685,11 +1122,12 @@ class Figure:
             rect.set('width', fmt((self.bbox.xmax-self.margin)*self.scale - (self.bbox.xmin+self.margin)*self.scale))
             rect.set('height', fmt(-(self.bbox.ymin+self.margin)*self.scale + (self.bbox.ymax-self.margin)*self.scale))
             rect.set('style', 'fill:none; stroke-width:1; stroke:red;')
+        return svg
 
-        # sort by zorder
-        elements = [k[1] for k in sorted(self.svgelements, key=lambda x: x[0])]
-        for elm in elements:
-            svg.append(elm)
+    def getsvg(self) -> ET.Element:
+        ''' Get the image as SVG XML Tree '''
+        svg = self._svgroot()
+        svg.extend(self._zordered())
         return svg
 
     def getimage(self, ext: str = 'svg') -> bytes:
@@ -703,6 +1141,12 @@ class Figure:
     def clear(self) -> None:
         ''' Remove everything '''
         self.svgelements = []
+        self.instances = {}
+        self.markers = {}
+        self.styles = {}
+        self.defs = {}
+        self.glyphs = {}
+        self.clips = {}
 
     def _repr_svg_(self):
         ''' SVG representation for Jupyter '''
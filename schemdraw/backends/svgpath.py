@@ -0,0 +1,110 @@
+''' Serialize drawing coordinates to SVG path and points data.
+
+    Numbers are formatted with the same rules as `svg.fmt` (fixed
+    precision with trailing zeros stripped), but whole coordinate
+    arrays are formatted in one pass and assembled with join.
+'''
+
+from __future__ import annotations
+
+from typing import Iterable, Sequence
+
+from ..types import XY
+
+
+def fmt_array(values: Iterable[float], precision: int = 3) -> list[str]:
+    ''' Format numbers to fixed precision, stripping trailing zeros '''
+    spec = f'.{precision}f'
+    return [format(v, spec).rstrip('0').rstrip('.') for v in values]
+
+
+def polyline_data(x: Sequence[float], y: Sequence[float],
+                  scale: float, precision: int = 3) -> str:
+    ''' Get path data for a polyline
+
+        Args:
+            x: X coordinates in drawing units
+            y: Y coordinates in drawing units
+            scale: Drawing units to SVG points. Y is inverted.
+            precision: Decimal places for coordinates
+
+        Returns:
+            Path `d` string. A NaN coordinate breaks the line,
+            starting a new subpath at the next point.
+    '''
+    start = 'M {},{}'.format(x[0]*scale, -y[0]*scale)
+    xs = fmt_array([xx*scale for xx in x[1:]], precision)
+    ys = fmt_array([-yy*scale for yy in y[1:]], precision)
+    coords = [f'{xx},{yy}' for xx, yy in zip(xs, ys)]
+    if not coords:
+        return start
+
+    if 'nan' not in xs and 'nan' not in ys:
+        return start + ' L ' + ' L '.join(coords)
+
+    tokens = [start]
+    newpath = False
+    for xx, yy, coord in zip(xs, ys, coords):
+        if xx == 'nan' or yy == 'nan':
+            tokens.append('M')
+            newpath = True
+        elif newpath:
+            tokens.append(coord)
+            newpath = False
+        else:
+            tokens.append('L ' + coord)
+    return ' '.join(tokens)
+
+
+def points_data(verts: Sequence[XY], scale: float, precision: int = 3) -> str:
+    ''' Get `points` attribute for a polyline or polygon
+
+        Args:
+            verts: Vertices in drawing units
+            scale: Drawing units to SVG points. Y is inverted.
+            precision: Decimal places for coordinates
+    '''
+    xs = fmt_array([v[0]*scale for v in verts], precision)
+    ys = fmt_array([-v[1]*scale for v in verts], precision)
+    return ''.join([f'{xx},{yy} ' for xx, yy in zip(xs, ys)])
+
+
+def relative_path_data(x: Sequence[float], y: Sequence[float],
+                       scale: float, precision: int = 3) -> str:
+    ''' Get compact path data for a polyline, using relative
+        h, v, and l commands after the initial move.
+
+        Args:
+            x: X coordinates in drawing units
+            y: Y coordinates in drawing units
+            scale: Drawing units to SVG points. Y is inverted.
+            precision: Decimal places for coordinates
+
+        Returns:
+            Path `d` string. A NaN coordinate breaks the line,
+            starting a new subpath at the next point.
+    '''
+    spec = f'.{precision}f'
+
+    def fmt(v: float) -> str:
+        return format(v, spec).rstrip('0').rstrip('.')
+
+    tokens = []
+    last = None  # Previous point, rounded, so deltas don't accumulate rounding error
+    for xx, yy in zip(x, y):
+        if xx != xx or yy != yy:
+            last = None
+            continue
+        px, py = round(xx*scale, precision), round(-yy*scale, precision)
+        if last is None:
+            tokens.append(f'M {fmt(px)},{fmt(py)}')
+        else:
+            dx, dy = round(px-last[0], precision), round(py-last[1], precision)
+            if dy == 0:
+                tokens.append(f'h {fmt(dx)}')
+            elif dx == 0:
+                tokens.append(f'v {fmt(dy)}')
+            else:
+                tokens.append(f'l {fmt(dx)},{fmt(dy)}')
+        last = px, py
+    return ' '.join(tokens)
@@ -1,3 +1,8 @@
 ''' The default canvas to draw on '''
+import importlib.util
 
-default_canvas = 'matplotlib'
+# Matplotlib is the default if installed, but isn't imported until first drawn on.
+# If the import then fails, backends.import_mpl switches the default to SVG.
+matplotlib_installed = importlib.util.find_spec('matplotlib') is not None
+default_canvas = 'matplotlib' if matplotlib_installed else 'svg'
+headless = False  # Draw Matplotlib figures on pooled Agg canvases, without pyplot
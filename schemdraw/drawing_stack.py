@@ -2,16 +2,21 @@
 
     This module tracks the active drawing and element for use in context
     managers, enabling of adding elements to a drawing without explicitly
-    calling `d.add` or `d +=`. The stack is a dictionary (relying on being
-    ordered) of drawing: element pairs. The last item in the dictionary
-    is the last drawing or container to be opened by `with` block, and
-    the element is the last element instantiated.
+    calling `d.add` or `d +=`. The stack is a tuple of (drawing, element)
+    frames. The last frame holds the last drawing or container to be
+    opened by `with` block, and the last element instantiated.
+
+    The stack is held in a ContextVar and replaced, never modified, on
+    every change. Each thread starts with an empty stack, so elements
+    created in another thread are not added to this thread's drawing.
+    An asyncio task starts with a copy of the stack where it was created,
+    and its changes to the stack don't affect the creating context.
 
     Typical order of operations:
 
     1) A drawing is added to the stack when the `with` block is opened
     2) When an element is instantiated inside the block, it is set as
-        the value of the drawing's dictionary item.
+        the element of the drawing's frame.
     3) When a different element is instantiated, the element in the
         stack will then be added to its drawing if it hasn't been added already.
         This allows the chained methods (such as `.up`, `.down`) to affect
@@ -25,33 +30,75 @@
 '''
 from __future__ import annotations
 from typing import Union, Optional, TYPE_CHECKING
+from contextvars import ContextVar
 
 if TYPE_CHECKING:
     from .schemdraw import Drawing
     from .elements import Element, Container
 
 DrawingType = Union['Drawing', 'Container']
+Frame = tuple  # (drawing, element)
+
+
+class DrawingStack:
+    ''' Stack of (drawing, element) frames, separate for each
+        thread or asyncio context
+    '''
+    def __init__(self):
+        self._frames: ContextVar[tuple[Frame, ...]] = ContextVar('drawing_stack', default=())
+
+    @property
+    def frames(self) -> tuple[Frame, ...]:
+        ''' The frames for the current context '''
+        return self._frames.get()
+
+    @frames.setter
+    def frames(self, frames: tuple[Frame, ...]) -> None:
+        self._frames.set(frames)
+
+    def top(self) -> Optional[Frame]:
+        ''' Get the last frame, or None if the stack is empty '''
+        frames = self._frames.get()
+        return frames[-1] if frames else None
+
+    def __len__(self) -> int:
+        return len(self._frames.get())
+
+    def __iter__(self):
+        return iter(self._frames.get())
+
 
-drawing_stack: dict[DrawingType, Optional['Element']] = {}  # {drawing: element}
+drawing_stack = DrawingStack()
 pause: bool = False
 
 
 def push_drawing(drawing: DrawingType) -> None:
     ''' Add a drawing to the stack '''
-    drawing_stack[drawing] = None
+    drawing_stack.frames += ((drawing, None),)
 
 
 def pop_drawing(drawing: DrawingType) -> None:
     ''' Remove the drawing from the stack '''
-    drawing_stack.pop(drawing)
+    frames = drawing_stack.frames
+    for i in range(len(frames)-1, -1, -1):
+        if frames[i][0] is drawing:
+            drawing_stack.frames = frames[:i] + frames[i+1:]
+            return
+    raise KeyError(drawing)
 
 
 def push_element(element: Optional['Element']) -> None:
     ''' Add a new element to the stack, placing the existing
         one if not already placed by the user
     '''
-    if not pause and len(drawing_stack) > 0:
-        drawing, prev_elm = list(drawing_stack.items())[-1]
-        if prev_elm is not None and prev_elm not in drawing:
-            drawing.add(prev_elm)
-        drawing_stack[drawing] = element
+    if not pause:
+        frame = drawing_stack.top()
+        if frame is not None:
+            drawing, prev_elm = frame
+            if prev_elm is not None and prev_elm not in drawing:
+                drawing.add(prev_elm)
+            frames = drawing_stack.frames  # Adding may have changed the stack
+            for i in range(len(frames)-1, -1, -1):
+                if frames[i][0] is drawing:
+                    drawing_stack.frames = frames[:i] + ((drawing, element),) + frames[i+1:]
+                    break
@@ -1,251 +1,361 @@
+''' Schemdraw electrical elements. Element modules are imported
+    when one of their elements is first used.
+'''
+from typing import TYPE_CHECKING
+import importlib
+
 from .elements import Element, ElementDrawing, Element2Term
 from .container import Container
-from .twoterm import (
-    Resistor,
-    ResistorIEEE,
-    ResistorIEC,
-    ResistorVar,
-    ResistorVarIEEE,
-    ResistorVarIEC,
-    Thermistor,
-    Photoresistor,
-    PhotoresistorIEEE,
-    PhotoresistorIEC,
-    Rshunt,
-    Capacitor,
-    Capacitor2,
-    CapacitorVar,
-    CapacitorTrim,
-    Diode,
-    Schottky,
-    DiodeTunnel,
-    DiodeShockley,
-    Zener,
-    DiodeTVS,
-    Varactor,
-    LED,
-    LED2,
-    Photodiode,
-    Potentiometer,
-    PotentiometerIEEE,
-    PotentiometerIEC,
-    Diac,
-    Triac,
-    SCR,
-    Memristor,
-    Memristor2,
-    Josephson,
-    Fuse,
-    FuseUS,
-    FuseIEEE,
-    FuseIEC,
-    Inductor,
-    Inductor2,
-    Crystal,
-    Breaker,
-    CPE,
-    SparkGap,
-    RBox,
-    RBoxVar,
-    PotBox,
-    PhotoresistorBox,
-    Nullator,
-    Norator,
-    CurrentMirror,
-    VoltageMirror
-)
-from .oneterm import (
-    Ground,
-    GroundSignal,
-    GroundChassis,
-    Antenna,
-    AntennaLoop,
-    AntennaLoop2,
-    Vss,
-    Vdd,
-    NoConnect
-)
-from .opamp import Opamp
-from .sources import (
-    Source,
-    SourceV,
-    SourceI,
-    SourceSin,
-    SourcePulse,
-    SourceSquare,
-    SourceTriangle,
-    SourceRamp,
-    SourceControlled,
-    SourceControlledV,
-    SourceControlledI,
-    BatteryCell,
-    Battery,
-    BatteryDouble,
-    MeterV,
-    MeterI,
-    MeterA,
-    MeterOhm,
-    MeterArrow,
-    Lamp,
-    Lamp2,
-    Solar,
-    Neon,
-    MeterBox,
-    MeterAnalog,
-    MeterDigital,
-    Oscilloscope
-)
-from .switches import (
-    Switch,
-    SwitchSpdt,
-    SwitchSpdt2,
-    SwitchDpst,
-    SwitchDpdt,
-    Button,
-    SwitchReed,
-    SwitchRotary,
-    SwitchDIP
-)
-from .transistors import (
-    NFet,
-    PFet,
-    AnalogNFet,
-    AnalogPFet,
-    AnalogBiasedFet,
-    JFet,
-    JFetN,
-    JFetP,
-    Bjt,
-    BjtNpn,
-    BjtPnp,
-    BjtPnp2c,
-    Bjt2,
-    BjtNpn2,
-    BjtPnp2,
-    IgbtN,
-    IgbtP,
-    NpnSchottky,
-    PnpSchottky,
-    NpnPhoto,
-    PnpPhoto,
-    BjtPnp2c2,
-    NFet2,
-    PFet2,
-    JFet2,
-    JFetN2,
-    JFetP2,
-    NMos,
-    PMos,
-    NMos2,
-    PMos2,
-    Hemt
-)
-from .misc import (
-    Speaker,
-    Mic,
-    Motor,
-    AudioJack
-)
-from .xform import Transformer
-from .cables import Coax, Triax
-from .intcircuits import (
-    IcPin,
-    Ic,
-    Multiplexer,
-    IcDIP,
-    VoltageRegulator,
-    DFlipFlop,
-    JKFlipFlop,
-    Ic555,
-    SevenSegment,
-    sevensegdigit
-)
-from .lines import (
-    Line,
-    DataBusLine,
-    Dot,
-    Arrowhead,
-    Arrow,
-    DotDotDot,
-    Wire,
-    Gap,
-    Label,
-    Tag,
-    CurrentLabel,
-    CurrentLabelInline,
-    VoltageLabelArc,
-    ZLabel,
-    LoopCurrent,
-    LoopArrow,
-    Rect,
-    Arc2,
-    Arc3,
-    ArcZ,
-    ArcN,
-    ArcLoop,
-    Annotate,
-    Encircle,
-    EncircleBox
-)
-from .connectors import (
-    OrthoLines,
-    RightLines,
-    Header,
-    Jumper,
-    BusConnect,
-    BusLine,
-    DB25,
-    DE9,
-    DB9,
-    DC37,
-    DA15,
-    DD50,
-    CoaxConnect,
-    Plug,
-    Jack,
-    Terminal
-)
-from .compound import (
-    ElementCompound,
-    Optocoupler,
-    Relay,
-    Rectifier,
-    Wheatstone
-)
-from .twoports import (
-    ElementTwoport,
-    TwoPort,
-    VoltageTransactor,
-    TransimpedanceTransactor,
-    CurrentTransactor,
-    TransadmittanceTransactor,
-    Nullor,
-    VMCMPair
-)
-from .outlets import (
-    OutletA,
-    OutletB,
-    OutletC,
-    OutletD,
-    OutletE,
-    OutletF,
-    OutletG,
-    OutletH,
-    OutletI,
-    OutletJ,
-    OutletK,
-    OutletL
-)
-from .tubes import (
-    VacuumTube,
-    DualVacuumTube,
-    NixieTube,
-    TubeDiode,
-    Triode,
-    Tetrode,
-    Pentode
+
+if TYPE_CHECKING:
+    from .twoterm import (
+        Resistor,
+        ResistorIEEE,
+        ResistorIEC,
+        ResistorVar,
+        ResistorVarIEEE,
+        ResistorVarIEC,
+        Thermistor,
+        Photoresistor,
+        PhotoresistorIEEE,
+        PhotoresistorIEC,
+        Rshunt,
+        Capacitor,
+        Capacitor2,
+        CapacitorVar,
+        CapacitorTrim,
+        Diode,
+        Schottky,
+        DiodeTunnel,
+        DiodeShockley,
+        Zener,
+        DiodeTVS,
+        Varactor,
+        LED,
+        LED2,
+        Photodiode,
+        Potentiometer,
+        PotentiometerIEEE,
+        PotentiometerIEC,
+        Diac,
+        Triac,
+        SCR,
+        Memristor,
+        Memristor2,
+        Josephson,
+        Fuse,
+        FuseUS,
+        FuseIEEE,
+        FuseIEC,
+        Inductor,
+        Inductor2,
+        Crystal,
+        Breaker,
+        CPE,
+        SparkGap,
+        RBox,
+        RBoxVar,
+        PotBox,
+        PhotoresistorBox,
+        Nullator,
+        Norator,
+        CurrentMirror,
+        VoltageMirror
+    )
+    from .oneterm import (
+        Ground,
+        GroundSignal,
+        GroundChassis,
+        Antenna,
+        AntennaLoop,
+        AntennaLoop2,
+        Vss,
+        Vdd,
+        NoConnect
+    )
+    from .opamp import Opamp
+    from .sources import (
+        Source,
+        SourceV,
+        SourceI,
+        SourceSin,
+        SourcePulse,
+        SourceSquare,
+        SourceTriangle,
+        SourceRamp,
+        SourceControlled,
+        SourceControlledV,
+        SourceControlledI,
+        BatteryCell,
+        Battery,
+        BatteryDouble,
+        MeterV,
+        MeterI,
+        MeterA,
+        MeterOhm,
+        MeterArrow,
+        Lamp,
+        Lamp2,
+        Solar,
+        Neon,
+        MeterBox,
+        MeterAnalog,
+        MeterDigital,
+        Oscilloscope
+    )
+    from .switches import (
+        Switch,
+        SwitchSpdt,
+        SwitchSpdt2,
+        SwitchDpst,
+        SwitchDpdt,
+        Button,
+        SwitchReed,
+        SwitchRotary,
+        SwitchDIP
+    )
+    from .transistors import (
+        NFet,
+        PFet,
+        AnalogNFet,
+        AnalogPFet,
+        AnalogBiasedFet,
+        JFet,
+        JFetN,
+        JFetP,
+        Bjt,
+        BjtNpn,
+        BjtPnp,
+        BjtPnp2c,
+        Bjt2,
+        BjtNpn2,
+        BjtPnp2,
+        IgbtN,
+        IgbtP,
+        NpnSchottky,
+        PnpSchottky,
+        NpnPhoto,
+        PnpPhoto,
+        BjtPnp2c2,
+        NFet2,
+        PFet2,
+        JFet2,
+        JFetN2,
+        JFetP2,
+        NMos,
+        PMos,
+        NMos2,
+        PMos2,
+        Hemt
+    )
+    from .misc import (
+        Speaker,
+        Mic,
+        Motor,
+        AudioJack
+    )
+    from .xform import Transformer
+    from .cables import Coax, Triax
+    from .intcircuits import (
+        IcPin,
+        Ic,
+        Multiplexer,
+        IcDIP,
+        VoltageRegulator,
+        DFlipFlop,
+        JKFlipFlop,
+        Ic555,
+        SevenSegment,
+        sevensegdigit
+    )
+    from .lines import (
+        Line,
+        DataBusLine,
+        Dot,
+        Arrowhead,
+        Arrow,
+        DotDotDot,
+        Wire,
+        Gap,
+        Label,
+        Tag,
+        CurrentLabel,
+        CurrentLabelInline,
+        VoltageLabelArc,
+        ZLabel,
+        LoopCurrent,
+        LoopArrow,
+        Rect,
+        Arc2,
+        Arc3,
+        ArcZ,
+        ArcN,
+        ArcLoop,
+        Annotate,
+        Encircle,
+        EncircleBox
+    )
+    from .connectors import (
+        OrthoLines,
+        RightLines,
+        Header,
+        Jumper,
+        BusConnect,
+        BusLine,
+        DB25,
+        DE9,
+        DB9,
+        DC37,
+        DA15,
+        DD50,
+        CoaxConnect,
+        Plug,
+        Jack,
+        Terminal
+    )
+    from .compound import (
+        ElementCompound,
+        Optocoupler,
+        Relay,
+        Rectifier,
+        Wheatstone
     )
-from .image import ElementImage
+    from .twoports import (
+        ElementTwoport,
+        TwoPort,
+        VoltageTransactor,
+        TransimpedanceTransactor,
+        CurrentTransactor,
+        TransadmittanceTransactor,
+        Nullor,
+        VMCMPair
+    )
+    from .outlets import (
+        OutletA,
+        OutletB,
+        OutletC,
+        OutletD,
+        OutletE,
+        OutletF,
+        OutletG,
+        OutletH,
+        OutletI,
+        OutletJ,
+        OutletK,
+        OutletL
+    )
+    from .tubes import (
+        VacuumTube,
+        DualVacuumTube,
+        NixieTube,
+        TubeDiode,
+        Triode,
+        Tetrode,
+        Pentode
+    )
+    from .image import ElementImage
+    from .twoterm import STYLE_IEEE, STYLE_IEC
+
+
+# Module defining each lazily-imported name
+_modules = {
+    'twoterm': (
+        'Resistor', 'ResistorIEEE', 'ResistorIEC', 'ResistorVar', 'ResistorVarIEEE',
+        'ResistorVarIEC', 'Thermistor', 'Photoresistor', 'PhotoresistorIEEE',
+        'PhotoresistorIEC', 'Rshunt', 'Capacitor', 'Capacitor2', 'CapacitorVar',
+        'CapacitorTrim', 'Diode', 'Schottky', 'DiodeTunnel', 'DiodeShockley', 'Zener',
+        'DiodeTVS', 'Varactor', 'LED', 'LED2', 'Photodiode', 'Potentiometer',
+        'PotentiometerIEEE', 'PotentiometerIEC', 'Diac', 'Triac', 'SCR', 'Memristor',
+        'Memristor2', 'Josephson', 'Fuse', 'FuseUS', 'FuseIEEE', 'FuseIEC', 'Inductor',
+        'Inductor2', 'Crystal', 'Breaker', 'CPE', 'SparkGap', 'RBox', 'RBoxVar',
+        'PotBox', 'PhotoresistorBox', 'Nullator', 'Norator', 'CurrentMirror',
+        'VoltageMirror', 'STYLE_IEEE', 'STYLE_IEC',
+    ),
+    'oneterm': (
+        'Ground', 'GroundSignal', 'GroundChassis', 'Antenna', 'AntennaLoop',
+        'AntennaLoop2', 'Vss', 'Vdd', 'NoConnect',
+    ),
+    'opamp': (
+        'Opamp',
+    ),
+    'sources': (
+        'Source', 'SourceV', 'SourceI', 'SourceSin', 'SourcePulse', 'SourceSquare',
+        'SourceTriangle', 'SourceRamp', 'SourceControlled', 'SourceControlledV',
+        'SourceControlledI', 'BatteryCell', 'Battery', 'BatteryDouble', 'MeterV',
+        'MeterI', 'MeterA', 'MeterOhm', 'MeterArrow', 'Lamp', 'Lamp2', 'Solar', 'Neon',
+        'MeterBox', 'MeterAnalog', 'MeterDigital', 'Oscilloscope',
+    ),
+    'switches': (
+        'Switch', 'SwitchSpdt', 'SwitchSpdt2', 'SwitchDpst', 'SwitchDpdt', 'Button',
+        'SwitchReed', 'SwitchRotary', 'SwitchDIP',
+    ),
+    'transistors': (
+        'NFet', 'PFet', 'AnalogNFet', 'AnalogPFet', 'AnalogBiasedFet', 'JFet', 'JFetN',
+        'JFetP', 'Bjt', 'BjtNpn', 'BjtPnp', 'BjtPnp2c', 'Bjt2', 'BjtNpn2', 'BjtPnp2',
+        'IgbtN', 'IgbtP', 'NpnSchottky', 'PnpSchottky', 'NpnPhoto', 'PnpPhoto',
+        'BjtPnp2c2', 'NFet2', 'PFet2', 'JFet2', 'JFetN2', 'JFetP2', 'NMos', 'PMos',
+        'NMos2', 'PMos2', 'Hemt',
+    ),
+    'misc': (
+        'Speaker', 'Mic', 'Motor', 'AudioJack',
+    ),
+    'xform': (
+        'Transformer',
+    ),
+    'cables': (
+        'Coax', 'Triax',
+    ),
+    'intcircuits': (
+        'IcPin', 'Ic', 'Multiplexer', 'IcDIP', 'VoltageRegulator', 'DFlipFlop',
+        'JKFlipFlop', 'Ic555', 'SevenSegment', 'sevensegdigit',
+    ),
+    'lines': (
+        'Line', 'DataBusLine', 'Dot', 'Arrowhead', 'Arrow', 'DotDotDot', 'Wire', 'Gap',
+        'Label', 'Tag', 'CurrentLabel', 'CurrentLabelInline', 'VoltageLabelArc',
+        'ZLabel', 'LoopCurrent', 'LoopArrow', 'Rect', 'Arc2', 'Arc3', 'ArcZ', 'ArcN',
+        'ArcLoop', 'Annotate', 'Encircle', 'EncircleBox',
+    ),
+    'connectors': (
+        'OrthoLines', 'RightLines', 'Header', 'Jumper', 'BusConnect', 'BusLine',
+        'DB25', 'DE9', 'DB9', 'DC37', 'DA15', 'DD50', 'CoaxConnect', 'Plug', 'Jack',
+        'Terminal',
+    ),
+    'compound': (
+        'ElementCompound', 'Optocoupler', 'Relay', 'Rectifier', 'Wheatstone',
+    ),
+    'twoports': (
+        'ElementTwoport', 'TwoPort', 'VoltageTransactor', 'TransimpedanceTransactor',
+        'CurrentTransactor', 'TransadmittanceTransactor', 'Nullor', 'VMCMPair',
+    ),
+    'outlets': (
+        'OutletA', 'OutletB', 'OutletC', 'OutletD', 'OutletE', 'OutletF', 'OutletG',
+        'OutletH', 'OutletI', 'OutletJ', 'OutletK', 'OutletL',
+    ),
+    'tubes': (
+        'VacuumTube', 'DualVacuumTube', 'NixieTube', 'TubeDiode', 'Triode', 'Tetrode',
+        'Pentode',
+    ),
+    'image': (
+        'ElementImage',
+    ),
+}
+_lazy = {name: module for module, names in _modules.items() for name in names}
+
+
+def __getattr__(name: str):
+    ''' Import the element's module on first use '''
+    if name in _modules:
+        return importlib.import_module(f'.{name}', __name__)
+    module = _lazy.get(name)
+    if module is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = getattr(importlib.import_module(f'.{module}', __name__), name)
+    globals()[name] = value
+    return value
+
+
+def __dir__():
+    return sorted(set(globals()) | set(_lazy) | set(_modules))
 
 
 __all__ = [
@@ -478,18 +588,6 @@ __all__ = [
 ]
 
 
-STYLE_IEEE = {'Resistor': ResistorIEEE,
-              'ResistorVar': ResistorVarIEEE,
-              'Potentiometer': PotentiometerIEEE,
-              'Photoresistor': PhotoresistorIEEE,
-              'Fuse': FuseUS}
-STYLE_IEC = {'Resistor': ResistorIEC,
-             'ResistorVar': ResistorVarIEC,
-             'Potentiometer': PotentiometerIEC,
-             'Photoresistor': PhotoresistorIEC,
-             'Fuse': FuseIEC}
-
-
 def style(style):
     ''' Set global element style
 
@@ -61,7 +61,8 @@ class ElementCompound(Element):
         ''' Add an element to the segments list '''
         self.elements.append(element)
         self._here, self._theta = element._place(self._here, self._theta, **self.dwgparams)
-        self.segments.extend([s.xform(element.transform, **element.params)
+        params = dict(element.params)
+        self.segments.extend([s.xform(element.transform, **params)
                               for s in element.segments])
         return element
 
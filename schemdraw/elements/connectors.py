@@ -50,8 +50,7 @@ class OrthoLines(Element):
 
     def _place(self, dwgxy: XY, dwgtheta: float, **dwgparams) -> tuple[Point, float]:
         ''' Calculate absolute placement of Element '''
-        self._dwgparams.clear()
-        self._dwgparams.update(dwgparams)
+        self._resolve_params(dwgparams)
         if not self._positioned:
             self._position()
 
@@ -135,8 +134,7 @@ class RightLines(Element):
 
     def _place(self, dwgxy: XY, dwgtheta: float, **dwgparams) -> tuple[Point, float]:
         ''' Calculate absolute placement of Element '''
-        self._dwgparams.clear()
-        self._dwgparams.update(dwgparams)
+        self._resolve_params(dwgparams)
         if not self._positioned:
             self._position()
 
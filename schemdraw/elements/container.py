@@ -38,7 +38,8 @@ class Container(Element):
                  pady: Optional[float] = None):
         super().__init__()
         self.drawing = drawing
-        self.elements: list[Element] = []
+        self._elements: list[Element] = []  # Read through the elements property
+        self._elementids: set[int] = set()
 
     def container(self,
                   cornerradius: Optional[float] = None,
@@ -64,7 +65,8 @@ class Container(Element):
 
     def add(self, element: Element) -> 'Container':
         ''' Add an element to the container '''
-        self.elements.append(element)
+        self._elements.append(element)
+        self._elementids.add(id(element))
         self.drawing.add(element)
         return self
 
@@ -77,7 +79,12 @@ class Container(Element):
         drawing_stack.pop_drawing(self)
 
     def __contains__(self, element):
-        return element in self.elements
+        return id(element) in self._elementids
+
+    @property
+    def elements(self) -> tuple[Element, ...]:
+        ''' Elements in the container, in the order they were added '''
+        return tuple(self._elements)
 
     def container_bbox(self, transform: bool = True) -> BBox:
         ''' Bounding box of the contents only '''
@@ -85,7 +92,7 @@ class Container(Element):
         xmax = -math.inf
         ymin = math.inf
         ymax = -math.inf
-        for element in self.elements:
+        for element in self._elements:
             bbox = element.get_bbox(transform=transform)
             xmin = min(bbox.xmin, xmin)
             xmax = max(bbox.xmax, xmax)
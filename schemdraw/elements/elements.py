@@ -17,14 +17,16 @@ from .. import drawing_stack
 from ..style import validate_color, validate_linestyle
 
 from ..backends.svg import Figure as svgFigure
-try:
-    from ..backends.mpl import Figure as mplFigure
-except ImportError:
-    mplFigure = None  # type: ignore
+from ..backends import mplFigure, import_mpl
 
 
 gap = (math.nan, math.nan)  # Put a gap in a path
 
+# Anchors that may be accessed as attributes before the element is placed
+ANCHOR_NAMES = frozenset(('start', 'end', 'center', 'istart', 'iend',
+                          'N', 'S', 'E', 'W', 'NE', 'NW', 'SE', 'SW',
+                          'NNE', 'NNW', 'ENE', 'WNW', 'SSE', 'SSW', 'ESE', 'WSW'))
+
 
 @dataclass
 class Label:
@@ -52,6 +54,34 @@ class LabelHint:
     fontsize: float | None = None
 
 
+class ElementDefaults(ChainMap):
+    ''' ChainMap of Element default parameters. Counts changes to
+        any element's defaults so values derived from them can be
+        invalidated.
+    '''
+    version = 0
+
+    def __setitem__(self, key, value):
+        super().__setitem__(key, value)
+        ElementDefaults.version += 1
+
+    def __delitem__(self, key):
+        super().__delitem__(key)
+        ElementDefaults.version += 1
+
+    def pop(self, key, *args):
+        ElementDefaults.version += 1
+        return super().pop(key, *args)
+
+    def popitem(self):
+        ElementDefaults.version += 1
+        return super().popitem()
+
+    def clear(self):
+        ElementDefaults.version += 1
+        super().clear()
+
+
 class Element:
     ''' Standard circuit element.
 
@@ -73,7 +103,8 @@ class Element:
         element in a Drawing.
     '''
     _element_defaults: dict[str, Any] = {}     # Default parameters for subclassed elements
-    defaults: ChainMap[str, Any] = ChainMap()  # Subclasses will chainmap this with parents
+    defaults: ChainMap[str, Any] = ElementDefaults()  # Subclasses will chainmap this with parents
+    _flatdefaults: tuple[int, dict[str, Any]] = (-1, {})  # (version, flattened defaults)
 
     def __init__(self, **kwargs) -> None:
         self._userparams.update(kwargs)         # Specified by user
@@ -98,9 +129,31 @@ class Element:
         new._dwgparams = {}  # Defaults from drawing
         new.elmparams = {}  # Parameters specified by element. Similar to _element_defaults, but may be dynamic
         new._userparams = {name: value for name, value in kwargs.items() if value is not None}
-        new.params = ChainMap(new._userparams, new.elmparams, new.defaults, new._dwgparams)
+        new.params = ChainMap(new._userparams, new.elmparams, cls._class_defaults(), new._dwgparams)
         return new
 
+    @classmethod
+    def _class_defaults(cls) -> dict[str, Any]:
+        ''' Class defaults flattened into a single dictionary, rebuilt
+            when any Element defaults are changed. Shared by all instances
+            of the class, so must not be modified.
+        '''
+        # Look only in this class's own __dict__. An inherited entry holds
+        # the parent's defaults, not this class's.
+        version, flat = cls.__dict__.get('_flatdefaults', (-1, {}))
+        if version != ElementDefaults.version:
+            flat = dict(cls.defaults)
+            cls._flatdefaults = (ElementDefaults.version, flat)
+        return flat
+
+    def _resolve_params(self, dwgparams: dict[str, Any]) -> None:
+        ''' Resolve the parameter chain when the element is placed,
+            using the drawing parameters and current class defaults
+        '''
+        self._dwgparams.clear()  # Don't remove the original object so self.params ChainMap gets the new values.
+        self._dwgparams.update(dwgparams)
+        self.params.maps[2] = self._class_defaults()
+
     def __init_subclass__(cls):
         ''' Initialize an Element subclass, building chainmap of default parameters
             from parent classes.
@@ -111,20 +164,19 @@ class Element:
             else:
                 cls.defaults = cls.__mro__[1].defaults.new_child()
         else:
-            cls.defaults = ChainMap()
+            cls.defaults = ElementDefaults()
 
     def __getattr__(self, name: str) -> Any:
         ''' Allow getting anchor position as attribute '''
-        anchornames = ['start', 'end', 'center', 'istart', 'iend',
-                       'N', 'S', 'E', 'W', 'NE', 'NW', 'SE', 'SW',
-                       'NNE', 'NNW', 'ENE', 'WNW', 'SSE', 'SSW', 'ESE', 'WSW']
-        if (name in anchornames + list(vars(self).get('anchors', {}).keys()) and
-            name not in vars(self).get('absanchors', {})):
-                # Not placed yet
-                drawing_stack.push_element(self)
-
-        if name in vars(self).get('absanchors', {}):
-            return vars(self).get('absanchors')[name]  # type: ignore
+        absanchors = vars(self).get('absanchors', {})
+        if name not in absanchors and (
+                name in ANCHOR_NAMES or name in vars(self).get('anchors', {})):
+            # Not placed yet
+            drawing_stack.push_element(self)
+            absanchors = vars(self).get('absanchors', {})
+
+        if name in absanchors:
+            return absanchors[name]
         raise AttributeError(f'{name} not defined in Element')
 
     def __getitem__(self, name: str) -> XY:
@@ -404,8 +456,7 @@ class Element:
                 xy: New XY position after placing the element
                 theta: New theta after placing the element
         '''
-        self._dwgparams.clear()  # Don't remove the original object so self.params ChainMap gets the new values.
-        self._dwgparams.update(dwgparams)
+        self._resolve_params(dwgparams)
         if not self._positioned:
             self._position()
 
@@ -496,9 +547,8 @@ class Element:
         for segment in self.segments:
             if not includetext and isinstance(segment, SegmentText):
                 continue
-            if transform:
-                segment = segment.xform(self.transform)
-            segxmin, segymin, segxmax, segymax = segment.get_bbox()
+            segxmin, segymin, segxmax, segymax = segment.get_bbox(
+                self.transform if transform else None)
             xmin = min(xmin, segxmin)
             xmax = max(xmax, segxmax)
             ymin = min(ymin, segymin)
@@ -752,8 +802,8 @@ class Element:
 
     def _draw_on_figure(self):
         ''' Draw the element on a new figure. Useful for _repr_ functions. '''
-        if default_canvas.default_canvas == 'matplotlib':
-            fig = mplFigure()
+        if default_canvas.default_canvas == 'matplotlib' and import_mpl():
+            fig = mplFigure(headless=default_canvas.headless)
         else:
             fig = svgFigure(bbox=self.get_bbox(transform=True))
         if not self._positioned:
@@ -765,14 +815,20 @@ class Element:
     def _repr_svg_(self):
         ''' SVG representation for Jupyter '''
         fig = self._draw_on_figure()
-        return fig.getimage(ext='svg').decode()
+        image = fig.getimage(ext='svg').decode()
+        if hasattr(fig, 'release'):
+            fig.release()
+        return image
 
     def _repr_png_(self):
         ''' PNG representation for Jupyter '''
-        if default_canvas.default_canvas == 'svg':
+        if default_canvas.default_canvas == 'svg' or not import_mpl():
             return None
         fig = self._draw_on_figure()
-        return fig.getimage(ext='png')
+        image = fig.getimage(ext='png')
+        if hasattr(fig, 'release'):
+            fig.release()
+        return image
 
     def _draw(self, fig) -> None:
         ''' Draw the element on a Figure '''
@@ -782,8 +838,16 @@ class Element:
         if 'gradient' in self.params:
             self._userparams['fill'] = fig.add_gradient(self.params['gradient'])
 
-        for segment in self.segments:
-            segment.draw(fig, self.transform, **self.params)
+        params = dict(self.params)  # Resolve once for all segments
+        segments = self.segments
+        if getattr(fig, 'instancing', False):
+            # Text is kept upright, so it can't rotate with the instance
+            shapes = [s for s in segments if not isinstance(s, SegmentText)]
+            if fig.draw_instance(shapes, self.transform, params):
+                segments = [s for s in segments if isinstance(s, SegmentText)]
+
+        for segment in segments:
+            segment.draw(fig, self.transform, **params)
 
         if self.params.get('elmbbox', False):
             # Draw element bounding box
@@ -910,8 +974,7 @@ class Element2Term(Element):
 
     def _place(self, dwgxy: XY, dwgtheta: float, **dwgparams) -> tuple[Point, float]:
         ''' Calculate element placement, adding lead extensions '''
-        self._dwgparams.clear()
-        self._dwgparams.update(dwgparams)
+        self._resolve_params(dwgparams)
         if not self._positioned:
             self._position()
 
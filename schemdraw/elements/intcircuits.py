@@ -8,6 +8,7 @@ from dataclasses import dataclass, replace
 
 from ..segments import Segment, SegmentText, SegmentCircle, SegmentPoly, SegmentType
 from ..elements import Element
+from .elements import ANCHOR_NAMES
 from ..util import linspace, Point
 from ..types import XY, Side, Halign, Valign
 from ..backends.svg import text_size
@@ -92,6 +93,7 @@ class Ic(Element):
         self._sizeauto: Optional[tuple[float, float]] = None
         self.slant = slant
         self.pins: dict[Side, list[IcPin]] = {'L': [], 'R': [], 'T': [], 'B': []}
+        self._pinanchors: set[str] = set()  # Anchor names provided by pins
         self.usersides: dict[Side, IcSide] = {}
         self.sides: dict[Side, IcSide] = {}
         self._dflt_side = IcSide(
@@ -106,30 +108,33 @@ class Ic(Element):
         if pins is not None:
             for pin in pins:
                 side = cast(Side, pin.side[0].upper())
-                self.pins[side].append(pin)
+                self._addpin(side, pin)
 
         self._icbox = IcBox(0, 0, 0, 0)
         self._setsize()
 
     def __getattr__(self, name: str) -> Any:
         ''' Allow getting anchor position as attribute '''
-        anchornames = ['start', 'end', 'center', 'istart', 'iend',
-                       'N', 'S', 'E', 'W', 'NE', 'NW', 'SE', 'SW',
-                       'NNE', 'NNW', 'ENE', 'WNW', 'SSE', 'SSW', 'ESE', 'WSW']
-        anchornames += list(vars(self).get('anchors', {}).keys())
-        anchornames += self.pinnames
-        anchornames += [f'pin{p.pin}' for p in self.pins.get('L', [])]
-        anchornames += [f'pin{p.pin}' for p in self.pins.get('R', [])]
-        anchornames += [f'pin{p.pin}' for p in self.pins.get('T', [])]
-        anchornames += [f'pin{p.pin}' for p in self.pins.get('B', [])]
-        if (name in anchornames and name not in vars(self).get('absanchors', {})):
+        absanchors = vars(self).get('absanchors', {})
+        if name not in absanchors and (
+                name in ANCHOR_NAMES or
+                name in vars(self).get('anchors', {}) or
+                name in vars(self).get('_pinanchors', ())):
             # Not placed yet
             drawing_stack.push_element(self)
+            absanchors = vars(self).get('absanchors', {})
 
-        if name in vars(self).get('absanchors', {}):
-            return vars(self).get('absanchors')[name]  # type: ignore
+        if name in absanchors:
+            return absanchors[name]
         raise AttributeError(f'{name} not defined in Element')
 
+    def _addpin(self, side: Side, pin: IcPin) -> None:
+        ''' Add a pin to the side, and index its anchor names '''
+        self.pins[side].append(pin)
+        if pin.name:
+            self._pinanchors.add(pin.anchorname if pin.anchorname else pin.name)
+        self._pinanchors.add(f'pin{pin.pin}')
+
     @property
     def pinnames(self) -> list[str]:
         ''' List of all pin names '''
@@ -171,8 +176,8 @@ class Ic(Element):
                 decoration: "underline" or "overline"
         '''
         side = cast(Side, side[0].upper())
-        self.pins[side].append(IcPin(name, pin, side, pos, slot, invert,
-                                    invertradius, color, rotation, anchorname, lblsize, href, decoration))
+        self._addpin(side, IcPin(name, pin, side, pos, slot, invert,
+                                 invertradius, color, rotation, anchorname, lblsize, href, decoration))
         self._setsize()
         return self
 
@@ -218,8 +218,7 @@ class Wire(Element):
 
     def _place(self, dwgxy: XY, dwgtheta: float, **dwgparams) -> tuple[Point, float]:
         ''' Calculate absolute placement of Element '''
-        self._dwgparams.clear()
-        self._dwgparams.update(dwgparams)
+        self._resolve_params(dwgparams)
         if not self._positioned:
             self._position()
 
@@ -331,8 +330,7 @@ class Arc2(Element):
 
     def _place(self, dwgxy: XY, dwgtheta: float, **dwgparams) -> tuple[Point, float]:
         ''' Calculate absolute placement of Element '''
-        self._dwgparams.clear()
-        self._dwgparams.update(dwgparams)
+        self._resolve_params(dwgparams)
         if not self._positioned:
             self._position()
 
@@ -444,8 +442,7 @@ class Arc3(Element):
 
     def _place(self, dwgxy: XY, dwgtheta: float, **dwgparams) -> tuple[Point, float]:
         ''' Calculate absolute placement of Element '''
-        self._dwgparams.clear()
-        self._dwgparams.update(dwgparams)
+        self._resolve_params(dwgparams)
         if not self._positioned:
             self._position()
 
@@ -657,8 +654,7 @@ class ArcLoop(Element):
 
     def _place(self, dwgxy: XY, dwgtheta: float, **dwgparams) -> tuple[Point, float]:
         ''' Calculate placement of Element '''
-        self._dwgparams.clear()
-        self._dwgparams.update(dwgparams)
+        self._resolve_params(dwgparams)
         if not self._positioned:
             self._position()
 
@@ -1051,8 +1047,7 @@ class ZLabel(Element):
         return self
 
     def _place(self, dwgxy, dwgtheta, **dwgparams):
-        self._dwgparams.clear()
-        self._dwgparams.update(dwgparams)
+        self._resolve_params(dwgparams)
         if not self._positioned:
             self._position()
 
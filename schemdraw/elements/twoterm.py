@@ -921,3 +921,15 @@ RBox = ResistorIEC
 RBoxVar = ResistorVarIEC
 PotBox = PotentiometerIEC
 PhotoresistorBox = PhotoresistorIEC
+
+
+STYLE_IEEE = {'Resistor': ResistorIEEE,
+              'ResistorVar': ResistorVarIEEE,
+              'Potentiometer': PotentiometerIEEE,
+              'Photoresistor': PhotoresistorIEEE,
+              'Fuse': FuseUS}
+STYLE_IEC = {'Resistor': ResistorIEC,
+             'ResistorVar': ResistorVarIEC,
+             'Potentiometer': PotentiometerIEC,
+             'Photoresistor': PhotoresistorIEC,
+             'Fuse': FuseIEC}
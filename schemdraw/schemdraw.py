@@ -1,9 +1,11 @@
 ''' Schemdraw Drawing class '''
 
 from __future__ import annotations
-from typing import Any, MutableMapping, Union, Optional, TYPE_CHECKING
+from typing import Any, BinaryIO, MutableMapping, Union, Optional, TYPE_CHECKING
 from collections import ChainMap
+import os
 import math
+import time
 
 from . import default_canvas
 from .types import BBox, Backends, ImageFormat, Linestyle, XY, ImageType
@@ -11,27 +13,29 @@ from .elements import Element, Container
 from .segments import SegmentType
 from .util import Point
 from .backends.svg import Figure as svgFigure
+from .backends import mplFigure, import_mpl
 from . import drawing_stack
 
 if TYPE_CHECKING:
     import xml.etree.ElementTree.Element  # type: ignore
+    import matplotlib.pyplot.Axes   # type: ignore
+    from .backends import mpl
 
-try:
-    from .backends.mpl import Figure as mplFigure
-    default_canvas.default_canvas = 'matplotlib'
-    if TYPE_CHECKING:
-        import matplotlib.pyplot.Axes   # type: ignore
-except ImportError:
-    mplFigure = None  # type: ignore
-    default_canvas.default_canvas = 'svg'
 
+def use(backend: Backends = 'matplotlib', headless: bool = False) -> None:
+    ''' Change default backend, either 'matplotlib' or 'svg'
 
-def use(backend: Backends = 'matplotlib') -> None:
-    ''' Change default backend, either 'matplotlib' or 'svg' '''
+        Args:
+            backend: Name of the backend
+            headless: Draw Matplotlib figures without pyplot, on
+                reusable Agg canvases. Call `Drawing.release` when
+                done with a drawing to return its figure for reuse.
+    '''
     if backend == 'matplotlib':
-        if mplFigure is None:
+        if not import_mpl():
             raise ValueError('Could not import Matplotlib.')
     default_canvas.default_canvas = backend
+    default_canvas.headless = headless
 
 
 def config(unit: float = 3.0, inches_per_unit: float = 0.5,
@@ -39,7 +43,8 @@ def config(unit: float = 3.0, inches_per_unit: float = 0.5,
            font: str = 'sans-serif', color: str = 'black',
            lw: float = 2., ls: Linestyle = '-',
            fill: Optional[str] = None, bgcolor: Optional[str] = None,
-           margin: float = 0.1, mathfont: Optional[str] = None) -> None:
+           margin: float = 0.1, mathfont: Optional[str] = None,
+           simplify: float = 0) -> None:
     ''' Set global schemdraw style configuration
 
         Args:
@@ -55,6 +60,9 @@ def config(unit: float = 3.0, inches_per_unit: float = 0.5,
             fill: Deault fill color for closed elements
             margin: White space around the drawing in drawing units
             mathont: Font for math delimited by $..$
+            simplify: Remove points from lines and polygons when they are
+                within this distance (in drawing units) of the simplified
+                shape. Zero disables.
     '''
     schemdrawstyle['unit'] = unit
     schemdrawstyle['inches_per_unit'] = inches_per_unit
@@ -66,6 +74,7 @@ def config(unit: float = 3.0, inches_per_unit: float = 0.5,
     schemdrawstyle['ls'] = ls
     schemdrawstyle['fill'] = fill
     schemdrawstyle['margin'] = margin
+    figurestyle['simplify'] = simplify
     if bgcolor:
         schemdrawstyle['bgcolor'] = bgcolor
     if mathfont:
@@ -80,6 +89,7 @@ def debug(dwgbbox: bool = True,
 
 
 schemdrawstyle: dict[str, Any] = {}  # Global style
+figurestyle: dict[str, Any] = {}  # Global backend figure options, not passed to elements
 config()  # Initialize default configuration
 
 
@@ -189,9 +199,11 @@ class Drawing:
         self.canvas = canvas
         self.show = show
         self.saveopts = {'transparent': transparent, 'dpi': dpi}
-        self.elements: list[Element] = []
+        self._elements: list[Element] = []  # Read through the elements property
+        self._elementids: set[int] = set()  # id() of each element, for fast membership test
         self.anchors: MutableMapping[str, Union[Point, tuple[float, float]]] = {}  # Untransformed anchors
         self.svgdefs: list[str] = []
+        self.simplify: float = kwargs.pop('simplify', figurestyle['simplify'])
         self.dwgparams: dict[str, Any] = schemdrawstyle.copy()
         self.dwgparams.update(kwargs)  # To maintain support for arguments that moved to config method
         self.unit = kwargs.get('unit', schemdrawstyle.get('unit'))
@@ -200,7 +212,15 @@ class Drawing:
         self._theta: float = 0
         self._state: list[tuple[Point, float]] = []  # Push/Pop stack
         self._interactive = False
-        self.fig: Optional[Union[mplFigure, svgFigure]] = None
+        self._refresh_interval = .1  # Minimum seconds between interactive refreshes
+        self._lastrefresh = 0.
+        self._refreshtimer: Any = None  # Canvas timer for a deferred refresh
+        self._interactivefig: Optional[mpl.Figure] = None
+        self._artiststart: list[int] = []  # Index of each element's first artist in interactive fig
+        self._pending: list = []  # Artists drawn since the last refresh
+        self._bbox: Optional[BBox] = None  # Running bounding box of placed elements
+        self._bbox_count = 0  # Number of elements included in self._bbox
+        self.fig: Optional[Union[mpl.Figure, svgFigure]] = None
 
     @property
     def here(self):
@@ -270,34 +290,61 @@ class Drawing:
         raise AttributeError(f"'Drawing' has no attribute {name}")
 
     def __contains__(self, element):
-        return element in self.elements
+        return id(element) in self._elementids
 
-    def interactive(self, interactive: bool = True):
+    @property
+    def elements(self) -> tuple[Element, ...]:
+        ''' Elements in the drawing, in the order they were added.
+            Use `add` and `undo` to change them.
+        '''
+        return tuple(self._elements)
+
+    def interactive(self, interactive: bool = True, interval: float = .1):
         ''' Enable interactive mode (matplotlib backend only). Matplotlib
             must also be set to interactive with `plt.ion()`.
+
+            Args:
+                interactive: Enable interactive mode
+                interval: Minimum time, in seconds, between refreshes of
+                    the figure. Elements added sooner are shown by a
+                    deferred refresh at the end of the interval.
         '''
         self._interactive = interactive
+        self._refresh_interval = interval
 
     def get_bbox(self) -> BBox:
-        ''' Get drawing bounding box '''
-        xmin = math.inf
-        xmax = -math.inf
-        ymin = math.inf
-        ymax = -math.inf
-        for element in self.elements:
+        ''' Get drawing bounding box.
+
+            The bounding box is maintained incrementally, so only elements
+            added since the last call are measured. Removing elements
+            (see `undo`) or drawing the schematic measures all of them again.
+        '''
+        if self._bbox is None:
+            self._bbox = BBox(math.inf, math.inf, -math.inf, -math.inf)
+            self._bbox_count = 0
+
+        xmin, ymin, xmax, ymax = self._bbox
+        for element in self._elements[self._bbox_count:]:
             bbox = element.get_bbox(transform=True)
             xmin = min(bbox.xmin, xmin)
             xmax = max(bbox.xmax, xmax)
             ymin = min(bbox.ymin, ymin)
             ymax = max(bbox.ymax, ymax)
-        return BBox(xmin, ymin, xmax, ymax)
+        self._bbox = BBox(xmin, ymin, xmax, ymax)
+        self._bbox_count = len(self._elements)
+        return self._bbox
+
+    def _invalidate_bbox(self) -> None:
+        ''' Force the bounding box to be recalculated from all elements '''
+        self._bbox = None
+        self._bbox_count = 0
 
     def get_segments(self) -> list[SegmentType]:
         ''' Get flattened list of all segments in the drawing '''
         segments = []
-        for element in self.elements:
+        for element in self._elements:
             # Exclude drawing params from the chain
-            params = ChainMap(element._userparams, element.elmparams, element.defaults)
+            params = ChainMap(element._userparams, element.elmparams, element._class_defaults())
             segments.extend([s.xform(element.transform, **params)
                              for s in element.segments])
         return segments
@@ -324,21 +371,77 @@ class Drawing:
                 element: The element to add.
         '''
         self._here, self._theta = element._place(self._here, self._theta, **self.dwgparams)
-        self.elements.append(element)
+        self._elements.append(element)
+        self._elementids.add(id(element))
 
         if self._interactive:
-            if self.fig is None:
-                self.fig = mplFigure(
-                    inches_per_unit=self.dwgparams.get('inches_per_unit'))
+            if self.fig is None or self.fig is not self._interactivefig:
+                self.fig = self._interactivefig = mplFigure(
+                    inches_per_unit=self.dwgparams.get('inches_per_unit'),
+                    simplify=self.simplify,
+                    headless=default_canvas.headless)
                 if 'bgcolor' in self.dwgparams:
                     self.fig.bgcolor(self.dwgparams['bgcolor'])
-            element._draw(self.fig)
+                self._artiststart = []
+                self._pending = []
+                self._refreshtimer = None
+                for elm in self._elements:
+                    self._drawinteractive(elm)
+            else:
+                self._drawinteractive(element)
             self.fig.set_bbox(self.get_bbox())  # type: ignore
-            self.fig.getimage()  # type: ignore
+            self._refresh()
         else:
             self.fig = None  # Clear any existing figure
         return element
 
+    def _drawinteractive(self, element: Element) -> None:
+        ''' Draw one element on the interactive figure, keeping
+            track of its artists so it can be undone
+        '''
+        start = len(self.fig.artists)  # type: ignore
+        element._draw(self.fig)
+        self.fig.flush()  # type: ignore
+        self._artiststart.append(start)
+        self._pending.extend(self.fig.artists[start:])  # type: ignore
+
+    def _refresh(self, force: bool = False, redraw: bool = False) -> None:
+        ''' Refresh the interactive figure, at most once per interval
+            unless forced. Only the pending artists are drawn unless
+            redraw is set.
+        '''
+        now = time.monotonic()
+        wait = self._lastrefresh + self._refresh_interval - now
+        if not force and wait > 0:
+            if self._refreshtimer is None:
+                # Show the throttled elements at the end of the interval
+                timer = self.fig.fig.canvas.new_timer(interval=math.ceil(wait*1000))  # type: ignore
+                timer.single_shot = True
+                timer.add_callback(self._deferred_refresh)
+                timer.start()
+                self._refreshtimer = timer
+            return
+        if self._refreshtimer is not None:
+            self._refreshtimer.stop()
+            self._refreshtimer = None
+        self.fig.refresh(None if redraw else self._pending)  # type: ignore
+        self._pending = []
+        self._lastrefresh = time.monotonic()
+
+    def _deferred_refresh(self) -> None:
+        ''' Timer callback to refresh elements added during the interval '''
+        self._refreshtimer = None
+        if self._pending and self.fig is not None and self.fig is self._interactivefig:
+            self._refresh(force=True)
+
+    def refresh(self) -> None:
+        ''' Refresh the interactive figure now, showing any elements
+            added since the last refresh
+        '''
+        if self.fig is not None and self.fig is self._interactivefig:
+            self.fig.set_bbox(self.get_bbox())  # type: ignore
+            self._refresh(force=True)
+
     def add_elements(self, *elements: Element) -> None:
         ''' Add multiple elements to the drawing '''
         for element in elements:
@@ -346,13 +449,21 @@ class Drawing:
 
     def undo(self) -> None:
         ''' Removes previously added element '''
-        self.elements.pop(-1)
-        self.fig.clear()  # type: ignore
-        for element in self.elements:
-            element._draw(self.fig)
-        self._here, self._theta = self.elements[-1].absdrop
-        self.fig.set_bbox(self.get_bbox())  # type: ignore
-        self.fig.getimage()  # type: ignore
+        element = self._elements.pop(-1)
+        if not any(e is element for e in self._elements):
+            self._elementids.discard(id(element))
+        self._invalidate_bbox()
+        self._here, self._theta = self._elements[-1].absdrop
+        if self.fig is not None and self.fig is self._interactivefig:
+            # Remove only the undone element's artists
+            start = self._artiststart.pop()
+            for artist in self.fig.artists[start:]:  # type: ignore
+                artist.remove()
+            del self.fig.artists[start:]  # type: ignore
+            self.fig.set_bbox(self.get_bbox())  # type: ignore
+            self._refresh(force=True, redraw=True)
+        else:
+            self.fig = None  # Clear any existing figure
 
     def move(self, dx: float = 0, dy: float = 0) -> None:
         ''' Move the current drawing position
@@ -401,7 +512,8 @@ class Drawing:
                color: Optional[str] = None, lw: Optional[float] = None, ls: Optional[Linestyle] = None,
                fill: Optional[str] = None, bgcolor: Optional[str] = None,
                margin: Optional[float] = None,
-               mathfont: Optional[str] = None) -> None:
+               mathfont: Optional[str] = None,
+               simplify: Optional[float] = None) -> None:
         ''' Set Drawing configuration, overriding schemdraw global config.
 
             Args:
@@ -416,6 +528,9 @@ class Drawing:
                 ls: Default line style
                 fill: Deault fill color for closed elements
                 margin: White space around the drawing in drawing units
+                simplify: Remove points from lines and polygons when they are
+                    within this distance (in drawing units) of the simplified
+                    shape. Zero disables.
         '''
         if unit is not None:
             self.unit = unit
@@ -440,10 +555,12 @@ class Drawing:
             self.dwgparams['margin'] = margin
         if mathfont is not None:
             self.dwgparams['mathfont'] = mathfont
+        if simplify is not None:
+            self.simplify = simplify
 
     def _drawelements(self):
         ''' Draw all the elements on self.fig '''
-        for element in self.elements:
+        for element in self._elements:
             element._draw(self.fig)
 
     def _drawmpl(self, ax=None):
@@ -452,11 +569,14 @@ class Drawing:
             self.fig = mplFigure(ax=ax,
                                  inches_per_unit=self.dwgparams.get('inches_per_unit'),
                                  margin=self.dwgparams['margin'],
-                                 showbbox=self.dwgparams.get('dwgbbox', False))
+                                 showbbox=self.dwgparams.get('dwgbbox', False),
+                                 simplify=self.simplify,
+                                 headless=default_canvas.headless)
             if 'bgcolor' in self.dwgparams:
                 self.fig.bgcolor(self.dwgparams['bgcolor'])
         self.fig.set_bbox(self.get_bbox())  # type: ignore
         self._drawelements()
+        self.fig.flush()  # type: ignore
 
     def _drawsvg(self, svg=None):
         ''' Draw on SVG canvas '''
@@ -464,7 +584,8 @@ class Drawing:
             self.fig = svgFigure(svg=svg, bbox=self.get_bbox(),
                                  inches_per_unit=self.dwgparams.get('inches_per_unit'),
                                  margin=self.dwgparams.get('margin'),
-                                 showbbox=self.dwgparams.get('dwgbbox', False))
+                                 showbbox=self.dwgparams.get('dwgbbox', False),
+                                 simplify=self.simplify)
         if 'bgcolor' in self.dwgparams:
             self.fig.bgcolor(self.dwgparams['bgcolor'])
         self.fig.svgdefs.extend(self.svgdefs)
@@ -482,10 +603,13 @@ class Drawing:
                 schemdraw Figure object
         '''
         drawing_stack.push_element(None)
+        self._invalidate_bbox()  # Elements may have changed since they were added
 
         if canvas is None:
             canvas = self.canvas
         if canvas is None:
+            if default_canvas.default_canvas == 'matplotlib':
+                import_mpl()  # Falls back to SVG if Matplotlib fails to import
             canvas = default_canvas.default_canvas
 
         self.fig = None
@@ -507,12 +631,12 @@ class Drawing:
 
         return self.fig  # Return Figure and let _repr_ display it
 
-    def save(self, fname: str, transparent: bool = True, dpi: float = 72) -> None:
+    def save(self, fname: str | os.PathLike | BinaryIO, transparent: bool = True, dpi: float = 72) -> None:
         ''' Save figure to a file
 
             Args:
-                fname: Filename to save. In Matplotlib backend, the file
-                    type is automatically determined from extension
+                fname: Filename or binary stream to save. In Matplotlib backend,
+                    the file type is automatically determined from extension
                     (png, svg, jpg). SVG backend only supports saving SVG format.
                 transparent: Save as transparent background, if available
                 dpi: Dots-per-inch for raster formats
@@ -521,6 +645,15 @@ class Drawing:
             self.draw(show=False)
         self.fig.save(fname, transparent=transparent, dpi=dpi)  # type: ignore
 
+    def release(self) -> None:
+        ''' Release the drawing's figure. Headless Matplotlib figures
+            are returned to the pool for reuse by other drawings.
+            The drawing is redrawn if needed again.
+        '''
+        if self.fig is not None and hasattr(self.fig, 'release'):
+            self.fig.release()
+        self.fig = None
+
     def get_imagedata(self, fmt: ImageFormat | ImageType = 'svg') -> bytes:
         ''' Get image data as bytes array
 
@@ -11,22 +11,88 @@ import math
 from .types import BBox, XY, Linestyle, Capstyle, Joinstyle, Arcdirection, EndRef, RotationMode, Halign, Valign
 from . import util
 from .util import Point
+from .transform import Transform
 from .backends import svg
 
 
-def roundcorners(verts: Sequence[XY], radius: float = .5) -> Sequence[XY]:
-    ''' Round the corners of polygon defined by verts.
+def xform_bounds(points: Sequence[XY], transform: Transform) -> BBox:
+    ''' Bounding box of points after applying a transform, without
+        creating transformed Points
+
+        Args:
+            points: List of (x,y) points
+            transform: Transformation to apply
+    '''
+    a, b, c, d, e, f = transform.coefficients
+    x = [a*px + b*py + e for px, py in points]
+    y = [c*px + d*py + f for px, py in points]
+    return BBox(min(x), min(y), max(x), max(y))
+
+
+def bezier_extrema(p: Sequence[float]) -> list[float]:
+    ''' Values of a quadratic or cubic Bezier curve, in one coordinate,
+        at its endpoints and at any turning points between them.
+
+        Args:
+            p: One coordinate of the 3 or 4 control points
+    '''
+    if len(p) == 3:
+        # B'(t) = 0 is linear in t
+        p0, p1, p2 = p
+        values = [p0, p2]
+        denom = p0 - 2*p1 + p2
+        if denom != 0:
+            t = (p0 - p1) / denom
+            if 0 < t < 1:
+                values.append((1-t)**2*p0 + 2*(1-t)*t*p1 + t**2*p2)
+        return values
+
+    assert len(p) == 4
+    p0, p1, p2, p3 = p
+    values = [p0, p3]
+    # B'(t)/3 = a*t^2 + b*t + c
+    a = -p0 + 3*p1 - 3*p2 + p3
+    b = 2*(p0 - 2*p1 + p2)
+    c = p1 - p0
+    if abs(a) < 1E-12:
+        roots = [-c/b] if b != 0 else []
+    else:
+        disc = b*b - 4*a*c
+        if disc < 0:
+            roots = []
+        else:
+            sq = math.sqrt(disc)
+            roots = [(-b + sq) / (2*a), (-b - sq) / (2*a)]
+    for t in roots:
+        if 0 < t < 1:
+            values.append((1-t)**3*p0 + 3*(1-t)**2*t*p1 + 3*(1-t)*t**2*p2 + t**3*p3)
+    return values
+
+
+def corner_arcs(verts: Sequence[XY], radius: float = .5,
+                closed: bool = True) -> list[tuple[Point, float, float, float]]:
+    ''' Find the arcs that round the corners of polygon defined by verts.
         Works for convex polygons assuming radius fits inside.
 
         Args:
             verts: List of (x,y) pairs defining corners of polygon
             radius: Radius of curvature
+            closed: Round every corner of a closed polygon. If False,
+                the first and last vertices are ends of an open path
+                and are not rounded.
+
+        Returns:
+            List of (center, radius, startangle, endangle) for each corner,
+            in drawing order, which runs from the last vertex toward the
+            first. Angles are in radians. Arcs are drawn counterclockwise
+            if endangle > startangle, otherwise clockwise.
 
         Adapted from:
         https://stackoverflow.com/questions/24771828/algorithm-for-creating-rounded-corners-in-a-polygon
     '''
-    poly: list[Point] = []
-    for v in range(len(verts))[::-1]:
+    arcs: list[tuple[Point, float, float, float]] = []
+    last = 0 if closed else 2  # Open paths have no corner at verts[0] or verts[-1]
+    for v in range(len(verts)-1, last-1, -1):
         p1 = verts[v]
         p2 = verts[v-1]
         p3 = verts[v-2]
@@ -68,13 +134,34 @@ def roundcorners(verts: Sequence[XY], radius: float = .5) -> Sequence[XY]:
 
         while endangle < startangle:
             endangle += 2*math.pi
+        if endangle - startangle > math.pi:
+            # Clockwise polygon. A corner never turns more than 180 degrees.
+            endangle -= 2*math.pi
+
+        arcs.append((Point(circlepoint), radius, startangle, endangle))
+    return arcs
 
-        ph = util.linspace(startangle, endangle, 100)
-        arc = [Point((circlepoint[0] + math.cos(i)*radius, circlepoint[1] + math.sin(i)*radius)) for i in ph]
 
-        poly.extend(arc)
-    poly.append(poly[0])  # Close the loop
-    return poly
+def arc_bounds(arcs: Sequence[tuple[XY, float, float, float]]) -> BBox:
+    ''' Bounding box of circular arcs
+
+        Args:
+            arcs: List of (center, radius, startangle, endangle), with
+                angles in radians
+    '''
+    x: list[float] = []
+    y: list[float] = []
+    for center, r, startangle, endangle in arcs:
+        startangle, endangle = min(startangle, endangle), max(startangle, endangle)
+        angles = [startangle, endangle]
+        # Add the axis crossings inside the arc
+        k = math.ceil(startangle / (math.pi/2))
+        while k * math.pi/2 < endangle:
+            angles.append(k * math.pi/2)
+            k += 1
+        x.extend(center[0] + r*math.cos(a) for a in angles)
+        y.extend(center[1] + r*math.sin(a) for a in angles)
+    return BBox(min(x), min(y), max(x), max(y))
 
 
 class Segment:
@@ -146,13 +233,20 @@ class Segment:
         params.update(style)
         return Segment(transform.transform_array(self.path), **params)
 
-    def get_bbox(self) -> BBox:
-        ''' Get bounding box (untransformed)
+    def get_bbox(self, transform: Optional[Transform] = None) -> BBox:
+        ''' Get bounding box
+
+            Args:
+                transform: Transformation to apply to the segment
+                    before finding its bounds
 
             Returns:
                 Bounding box limits: (xmin, ymin, xmax, ymax)
         '''
         hw = self.arrowwidth if self.arrow else 0
+        if transform is not None:
+            xmin, ymin, xmax, ymax = xform_bounds(self.path, transform)
+            return BBox(xmin, ymin-hw, xmax, ymax+hw)
         x = [p[0] for p in self.path]
         y = [p[1] for p in self.path]
         return BBox(min(x), min(y)-hw, max(x), max(y)+hw)
@@ -348,8 +442,12 @@ class SegmentText:
         return SegmentText(transform.transform(self.xy),
                            self.text, **params)
 
-    def get_bbox(self) -> BBox:
-        ''' Get bounding box (untransformed)
+    def get_bbox(self, transform: Optional[Transform] = None) -> BBox:
+        ''' Get bounding box
+
+            Args:
+                transform: Transformation to apply to the segment
+                    before finding its bounds
 
             Returns:
                 Bounding box limits (xmin, ymin, xmax, ymax)
@@ -363,8 +461,7 @@ class SegmentText:
         w *= SCALE
         h *= SCALE
         dy *= SCALE
-        x = self.xy[0]
-        y = self.xy[1]
+        x, y = self.xy if transform is None else transform.transform(self.xy)
         nlines = len(self.text.splitlines())
 
         if self.align is not None:
@@ -504,12 +601,30 @@ class SegmentPoly:
         params.update(style)
         return SegmentPoly(transform.transform_array(self.verts), **params)
 
-    def get_bbox(self) -> BBox:
-        ''' Get bounding box (untransformed)
+    def get_bbox(self, transform: Optional[Transform] = None) -> BBox:
+        ''' Get bounding box
+
+            Args:
+                transform: Transformation to apply to the segment
+                    before finding its bounds
 
             Returns:
                 Bounding box limits (xmin, ymin, xmax, ymax)
         '''
+        if self.cornerradius > 0:
+            verts = self.verts if transform is None else transform.transform_array(self.verts)
+            arcs = corner_arcs(verts, self.cornerradius, self.closed)
+            if self.closed:
+                return arc_bounds(arcs)
+            x = [verts[0][0], verts[-1][0]]  # Open path ends
+            y = [verts[0][1], verts[-1][1]]
+            if arcs:
+                bbox = arc_bounds(arcs)
+                x.extend((bbox.xmin, bbox.xmax))
+                y.extend((bbox.ymin, bbox.ymax))
+            return BBox(min(x), min(y), max(x), max(y))
+        if transform is not None:
+            return xform_bounds(self.verts, transform)
         x = [p[0] for p in self.verts]
         y = [p[1] for p in self.verts]
         return BBox(min(x), min(y), max(x), max(y))
@@ -543,7 +658,13 @@ class SegmentPoly:
         verts = transform.transform_array(self.verts)
 
         if self.cornerradius > 0:
-            verts = roundcorners(verts, self.cornerradius)
+            arcs = [(center, r, math.degrees(startangle), math.degrees(endangle))
+                    for center, r, startangle, endangle
+                    in corner_arcs(verts, self.cornerradius, self.closed)]
+            ends = None if self.closed else (verts[-1], verts[0])
+            fig.roundpoly(arcs, ends=ends, color=color, fill=fill, lw=lw, ls=ls, hatch=self.hatch,
+                          capstyle=capstyle, joinstyle=joinstyle, clip=self.clip, zorder=zorder)
+            return
 
         fig.poly(verts, closed=self.closed, color=color, fill=fill, lw=lw, ls=ls,
                  hatch=self.hatch, capstyle=capstyle, joinstyle=joinstyle, clip=self.clip, zorder=zorder)
@@ -627,16 +748,26 @@ class SegmentCircle:
                           angle=transform.theta,
                           theta1=0, theta2=360, **params)
 
-    def get_bbox(self) -> BBox:
-        ''' Get bounding box (untransformed)
+    def get_bbox(self, transform: Optional[Transform] = None) -> BBox:
+        ''' Get bounding box
+
+            Args:
+                transform: Transformation to apply to the segment
+                    before finding its bounds
 
             Returns:
                 Bounding box limits (xmin, ymin, xmax, ymax)
         '''
-        xmin = self.center[0] - self.radius
-        xmax = self.center[0] + self.radius
-        ymin = self.center[1] - self.radius
-        ymax = self.center[1] + self.radius
+        center, radius = self.center, self.radius
+        if transform is not None:
+            if transform.zoom[0] != transform.zoom[1]:
+                return self.xform(transform).get_bbox()  # Ellipse
+            center = transform.transform(center)
+            radius = radius * transform.zoom[0]
+        xmin = center[0] - radius
+        xmax = center[0] + radius
+        ymin = center[1] - radius
+        ymax = center[1] + radius
         return BBox(xmin, ymin, xmax, ymax)
 
     def draw(self, fig, transform, **style) -> None:
@@ -753,27 +884,19 @@ class SegmentBezier:
         params.update(style)
         return SegmentBezier(transform.transform_array(self.p), **params)
 
-    def get_bbox(self) -> BBox:
-        ''' Get bounding box (untransformed)
+    def get_bbox(self, transform: Optional[Transform] = None) -> BBox:
+        ''' Get bounding box
+
+            Args:
+                transform: Transformation to apply to the segment
+                    before finding its bounds
 
             Returns:
                 Bounding box limits (xmin, ymin, xmax, ymax)
         '''
-        # Brute-force approximate from Bezier curve parametric equation
-        t = util.linspace(0, 1, 50)
-        px = [p.x for p in self.p]
-        py = [p.y for p in self.p]
-        if len(self.p) == 3:
-            x = [(1-tt)**2 * px[0] + 2*(1-tt)*tt*px[1] + tt**2*px[2]
-                 for tt in t]
-            y = [(1-tt)**2 * py[0] + 2*(1-tt)*tt*py[1] + tt**2*py[2]
-                 for tt in t]
-        else:
-            assert len(self.p) == 4
-            x = [(1-tt)**3 * px[0] + 3*(1-tt)**2*tt*px[1] + 3*(1-tt)*tt**2*px[2] + tt**3*px[3]
-                 for tt in t]
-            y = [(1-tt)**3 * py[0] + 3*(1-tt)**2*tt*py[1] + 3*(1-tt)*tt**2*py[2] + tt**3*py[3]
-                 for tt in t]
+        points = self.p if transform is None else transform.transform_array(self.p)
+        x = bezier_extrema([p[0] for p in points])
+        y = bezier_extrema([p[1] for p in points])
         return BBox(min(x), min(y), max(x), max(y))
 
     def draw(self, fig, transform, **style) -> None:
@@ -887,13 +1010,18 @@ class SegmentArc:
                           theta1=self.theta1,
                           theta2=self.theta2, **params)
 
-    def get_bbox(self) -> BBox:
-        ''' Get bounding box (untransformed)
+    def get_bbox(self, transform: Optional[Transform] = None) -> BBox:
+        ''' Get bounding box
+
+            Args:
+                transform: Transformation to apply to the segment
+                    before finding its bounds
 
             Returns:
                 Bounding box limits (xmin, ymin, xmax, ymax)
         '''
-        # Who wants to do trigonometry when we can just brute-force the bounding box?
+        if transform is not None:
+            return self.xform(transform).get_bbox()
         theta1, theta2 = math.radians(self.theta1), math.radians(self.theta2)
         # the phi parameter in parametric form is not the same as the angle along ellipse
         # (see https://www.petercollingridge.co.uk/tutorials/computational-geometry/finding-angle-around-ellipse/)
@@ -901,14 +1029,23 @@ class SegmentArc:
         t2 = math.atan2(self.width*math.sin(theta2), self.height*math.cos(theta2))
         while t2 < t1:
             t2 += 2*math.pi
-        t = util.linspace(t1, t2, num=500)
-        sint = list(map(math.sin, t))
-        cost = list(map(math.cos, t))
         phi = math.radians(self.angle)
         cosphi = math.cos(phi)
         sinphi = math.sin(phi)
         rx = self.width/2
         ry = self.height/2
+
+        # Extremes are at the arc endpoints, or where the ellipse
+        # crosses its x or y extent within the arc
+        tx = math.atan2(-ry*sinphi, rx*cosphi)
+        ty = math.atan2(ry*cosphi, rx*sinphi)
+        t = [t1, t2]
+        for tc in (tx, tx+math.pi, ty, ty+math.pi):
+            tc = t1 + (tc - t1) % (2*math.pi)
+            if tc <= t2:
+                t.append(tc)
+        sint = list(map(math.sin, t))
+        cost = list(map(math.cos, t))
         xx = [self.center[0] + rx * ct*cosphi - ry * st*sinphi for st, ct in zip(sint, cost)]
         yy = [self.center[1] + rx * ct*sinphi + ry * st*cosphi for st, ct in zip(sint, cost)]
         return BBox(min(xx), min(yy), max(xx), max(yy))
@@ -991,21 +1128,23 @@ class SegmentPath:
         style = {k: v for k, v in style.items() if params.get(k) is None and k in params.keys()}
         params.update(style)
 
-        xpath = []
-        for p in self.path:
-            try:  # Point
-                xpath.append(transform.transform(Point(p)))  # type: ignore
-            except TypeError:
-                xpath.append(p)  # String
+        xpath = [p if isinstance(p, str) else transform.transform(p)
+                 for p in self.path]
 
         return SegmentPath(xpath, **params)
 
-    def get_bbox(self) -> BBox:
-        ''' Get bounding box (untransformed)
+    def get_bbox(self, transform: Optional[Transform] = None) -> BBox:
+        ''' Get bounding box
+
+            Args:
+                transform: Transformation to apply to the segment
+                    before finding its bounds
 
             Returns:
                 Bounding box limits: (xmin, ymin, xmax, ymax)
         '''
+        if transform is not None:
+            return xform_bounds([p for p in self.path if not isinstance(p, str)], transform)
         x = [p[0] for p in self.path if not isinstance(p, str)]
         y = [p[1] for p in self.path if not isinstance(p, str)]
         return BBox(min(x), min(y), max(x), max(y))
@@ -1029,12 +1168,8 @@ class SegmentPath:
         if not self.visible:
             return
 
-        xpath = []
-        for p in self.path:
-            try:  # Point
-                xpath.append(transform.transform(Point(p)))  # type: ignore
-            except TypeError:
-                xpath.append(p)  # String
+        xpath = [p if isinstance(p, str) else transform.transform(p)
+                 for p in self.path]
 
         zorder = self.zorder if self.zorder is not None else style.get('zorder', 2)
         color = self.color if self.color else style.get('color', 'black')
@@ -1068,12 +1203,18 @@ class SegmentImage:
         self.zorder = zorder
         self.visible = True
 
-    def get_bbox(self) -> BBox:
-        ''' Get bounding box (untransformed)
+    def get_bbox(self, transform: Optional[Transform] = None) -> BBox:
+        ''' Get bounding box
+
+            Args:
+                transform: Transformation to apply to the segment
+                    before finding its bounds
 
             Returns:
                 Bounding box limits (xmin, ymin, xmax, ymax)
         '''
+        if transform is not None:
+            return self.xform(transform).get_bbox()
         if self.rotate % 360 == 0:
             return BBox(self.xy.x, self.xy.y, self.xy.x+self.width, self.xy.y+self.height)
 
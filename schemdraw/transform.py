@@ -4,6 +4,7 @@
 
 from __future__ import annotations
 from typing import Sequence
+import math
 
 from .util import Point
 from .types import XY
@@ -27,9 +28,27 @@ class Transform:
             zoom = Point((zoom, zoom))
         self.zoom = zoom
 
+        # Affine coefficients: x' = a*x + b*y + e;  y' = c*x + d*y + f
+        co = math.cos(math.radians(theta))
+        so = math.sin(math.radians(theta))
+        zx, zy = zoom
+        a, b = co*zx, -so*zy
+        c, d = so*zx, co*zy
+        lx, ly = self.localshift
+        self._m = (a, b, c, d,
+                   a*lx + b*ly + self.shift[0],
+                   c*lx + d*ly + self.shift[1])
+
     def __repr__(self):
         return f'Transform: xy={self.shift}; theta={self.theta}; scale={self.zoom}; lshift={self.localshift}'
 
+    @property
+    def coefficients(self) -> tuple[float, float, float, float, float, float]:
+        ''' Affine coefficients (a, b, c, d, e, f), where
+            x' = a*x + b*y + e and y' = c*x + d*y + f
+        '''
+        return self._m
+
     def transform(self, pt: XY) -> Point:
         ''' Apply the transform to the point
 
@@ -39,7 +58,9 @@ class Transform:
             Returns:
                 Transformed (x, y) coordinates
         '''
-        return ((Point(pt) + self.localshift) * self.zoom).rotate(self.theta) + self.shift
+        a, b, c, d, e, f = self._m
+        x, y = pt
+        return Point((a*x + b*y + e, c*x + d*y + f))
 
     def transform_array(self, pts: Sequence[XY]) -> list[Point]:
         ''' Apply the transform to multiple points
@@ -50,4 +71,5 @@ class Transform:
             Returns:
                 List of transformed (x, y) points
         '''
-        return [self.transform(pt) for pt in pts]
+        a, b, c, d, e, f = self._m
+        return [Point((a*x + b*y + e, c*x + d*y + f)) for x, y in pts]